@@ -0,0 +1,18 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+RUNTIME_DIR = Path(__file__).resolve().parent.parent
+SEED_HOME = RUNTIME_DIR.parent / "agent"
+
+sys.path.insert(0, str(RUNTIME_DIR))
+
+
+@pytest.fixture
+def agent_home(tmp_path):
+    """A copy of the seed agent home."""
+    home = tmp_path / "agent"
+    shutil.copytree(SEED_HOME, home)
+    return home
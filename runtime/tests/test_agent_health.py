@@ -0,0 +1,13 @@
+from tooeybot.agent import Agent
+from tooeybot.config import Config
+
+
+def test_health_check_leaves_heavy_components_unbuilt(agent_home):
+    agent = Agent(Config(agent_home=agent_home))
+    agent.__dict__["_llm_reachable"] = lambda: True
+    
+    results = agent.health_check()
+    
+    assert results["invariants"]["ok"]
+    for name in ("context", "skill_manager", "belief_manager", "executor"):
+        assert name not in agent.__dict__
@@ -0,0 +1,51 @@
+import re
+import types
+
+from tooeybot.beliefs import BeliefManager
+
+
+class RecordingLLM:
+    """Answers NONE to every contradiction check and records what was asked."""
+    
+    def __init__(self):
+        self.prompts = []
+    
+    def chat(self, messages, temperature=None):
+        self.prompts.append(messages[-1].content)
+        return types.SimpleNamespace(content="CONTRADICTS: NONE\nREASON: consistent")
+
+
+def test_coherence_check_never_pairs_a_belief_with_itself(agent_home):
+    manager = BeliefManager(agent_home)
+    for belief in manager.get_all_beliefs():
+        manager.deprecate_belief(belief.belief_id, "test setup")
+    manager.add_belief("the build uses python three on linux")
+    manager.add_belief("the build uses python two on linux")
+    manager.add_belief("coffee is served at noon")
+    llm = RecordingLLM()
+    
+    manager.run_coherence_check(llm)
+    
+    assert len(llm.prompts) == 2
+    for prompt in llm.prompts:
+        claim = re.search(r"NEW CLAIM: (.*)", prompt).group(1)
+        existing = re.findall(r"^- B-\d+: (.*)$", prompt, re.M)
+        assert existing and claim not in existing
+
+
+def test_coherence_sample_skips_beliefs_below_the_llm_gate(agent_home):
+    manager = BeliefManager(agent_home)
+    for belief in manager.get_all_beliefs():
+        manager.deprecate_belief(belief.belief_id, "test setup")
+    # Twelve beliefs whose closest neighbour scores 1/3, then one close pair
+    for i in range(6):
+        manager.add_belief(f"topic{i} left{i}")
+        manager.add_belief(f"topic{i} right{i}")
+    manager.add_belief("the nightly backup runs at two")
+    manager.add_belief("the nightly backup runs at two am")
+    llm = RecordingLLM()
+    
+    manager.run_coherence_check(llm)
+    
+    assert len(llm.prompts) == 2
+    assert all("nightly backup" in prompt for prompt in llm.prompts)
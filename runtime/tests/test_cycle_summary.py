@@ -0,0 +1,41 @@
+import json
+
+from tooeybot.cycle import CycleHistory, CyclePhase, CycleState, Observation
+
+
+def _cycle(task_id, n):
+    return CycleState(
+        cycle_id=n,
+        task_id=task_id,
+        phase=CyclePhase.REFLECT,
+        observation=Observation(success=True, output="x" * 10000),
+    )
+
+
+def _assert_matches_history(history, task_id):
+    full = history.load_history(task_id)
+    count, recent = history.load_summary(task_id)
+    assert count == len(full)
+    assert [c.to_dict() for c in recent] == [c.to_dict() for c in full[-CycleHistory.SUMMARY_WINDOW:]]
+
+
+def test_summary_sidecar_tracks_offsets_not_records(agent_home):
+    history = CycleHistory(agent_home)
+    with history.append_session("T-1"):
+        for n in range(3):
+            history.append_cycle(_cycle("T-1", n))
+    for n in range(3, 8):
+        history.append_cycle(_cycle("T-1", n))
+    
+    _assert_matches_history(history, "T-1")
+    assert history.get_last_cycle("T-1").cycle_id == 7
+    # The sidecar stays small however large the cycles are
+    assert history.get_meta_file("T-1").stat().st_size < 200
+    
+    # A fresh instance reads the sidecar; a stale or old-format one is rebuilt
+    _assert_matches_history(CycleHistory(agent_home), "T-1")
+    with open(history.get_history_file("T-1"), "ab") as f:
+        f.write((json.dumps(_cycle("T-1", 8).to_dict()) + "\n").encode())
+    _assert_matches_history(CycleHistory(agent_home), "T-1")
+    history.get_meta_file("T-1").write_text('{"count": 1, "size": 0, "recent": []}')
+    _assert_matches_history(CycleHistory(agent_home), "T-1")
@@ -0,0 +1,26 @@
+import json
+import types
+
+from tooeybot import _fastjson
+from tooeybot._fastjson import dumps_line
+
+
+# Valid for json but rejected by orjson: non-str keys and a >64-bit int
+PAYLOAD = {"counts": {1: "one", 2: "two"}, "big": 2 ** 70, "text": "héllo"}
+EXPECTED = (json.dumps(PAYLOAD, separators=(",", ":"), ensure_ascii=False) + "\n").encode()
+
+
+def test_dumps_line_matches_json_for_payloads_orjson_rejects():
+    assert dumps_line(PAYLOAD) == EXPECTED
+
+
+def test_dumps_line_falls_back_when_orjson_raises(monkeypatch):
+    class JSONEncodeError(TypeError):
+        pass
+    
+    def dumps(obj, default=None, option=None):
+        raise JSONEncodeError("Dict key must be str")
+    
+    fake = types.SimpleNamespace(dumps=dumps, JSONEncodeError=JSONEncodeError, OPT_APPEND_NEWLINE=1)
+    monkeypatch.setattr(_fastjson, "orjson", fake)
+    assert dumps_line(PAYLOAD) == EXPECTED
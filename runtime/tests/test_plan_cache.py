@@ -0,0 +1,53 @@
+import json
+import types
+
+from tooeybot.agent import Agent
+from tooeybot.config import Config
+from tooeybot.cycle import PlanCache, ReasoningCycle
+
+
+class ScriptedLLM:
+    """Plans `echo hi`, then completes once that has run; counts plan calls."""
+    
+    def __init__(self):
+        self.plan_calls = 0
+    
+    def chat(self, messages, temperature=None):
+        prompt = messages[-1].content
+        if "planning the next step" in prompt:
+            self.plan_calls += 1
+            if "echo hi" in prompt:
+                action = {"action_type": "complete_task", "payload": {"summary": "done"}}
+            else:
+                action = {"action_type": "execute_command", "payload": {"command": "echo hi"}}
+            content = json.dumps({"goal": "g", "next_action": dict(action, reasoning=f"call {self.plan_calls}")})
+        elif "Reflect on the result" in prompt:
+            content = json.dumps({"progress_made": True, "what_learned": "echo works", "confidence": 0.9})
+        else:
+            content = "CONTINUE"
+        return types.SimpleNamespace(content=content)
+
+
+def test_plan_cache_hits_across_real_cycles(agent_home):
+    config = Config(agent_home=agent_home)
+    config.cache.enabled = True
+    agent = Agent(config)
+    llm = ScriptedLLM()
+    agent.__dict__["llm"] = llm
+    task = agent.tasks.create_task("Say hi", success_criteria=["prints hi"])
+    
+    # Two independent runs of the task's first cycle, really executing `echo hi`
+    first, second = [], []
+    cycle_a = ReasoningCycle(agent, task, 1, first)
+    first.append(cycle_a.run().state)
+    cycle_b = ReasoningCycle(agent, task, 1, second)
+    second.append(cycle_b.run().state)
+    assert llm.plan_calls == 1
+    
+    # Wall-clock timing differs between runs and must not affect the key
+    second[0].observation.duration_ms = first[0].observation.duration_ms + 7
+    assert PlanCache.make_key(task, first) == PlanCache.make_key(task, second)
+    
+    cycle_a.run_next(2)
+    cycle_b.run_next(2)
+    assert llm.plan_calls == 2
@@ -0,0 +1,44 @@
+import subprocess
+
+from tooeybot.beliefs import BeliefManager
+from tooeybot.maintenance import MaintenanceManager
+
+
+def _git_identity(monkeypatch):
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+
+
+def test_restore_snapshot_rolls_back_journaled_beliefs(agent_home, monkeypatch):
+    _git_identity(monkeypatch)
+    maintenance = MaintenanceManager(agent_home)
+    before = {b.belief_id for b in BeliefManager(agent_home).get_all_beliefs()}
+    
+    snapshot = maintenance.create_snapshot(reason="test")
+    assert snapshot["success"] and snapshot["tag"]
+    
+    added = BeliefManager(agent_home).add_belief("restores roll this belief back")
+    assert (agent_home / "memory" / "beliefs.journal.md").stat().st_size
+    
+    assert maintenance.restore_snapshot(snapshot["tag"])["success"]
+    
+    after = {b.belief_id for b in BeliefManager(agent_home).get_all_beliefs()}
+    assert added.belief_id not in after
+    assert after == before
+
+
+def test_snapshots_leave_out_belief_cache_and_lock(agent_home, monkeypatch):
+    _git_identity(monkeypatch)
+    beliefs = BeliefManager(agent_home)
+    beliefs.add_belief("snapshots only hold markdown")
+    beliefs.compact()
+    
+    assert MaintenanceManager(agent_home).create_snapshot(reason="test")["success"]
+    
+    tracked = subprocess.run(
+        ["git", "ls-files", "memory"], cwd=agent_home, capture_output=True, text=True
+    ).stdout.split()
+    assert "memory/beliefs.md" in tracked
+    assert not [path for path in tracked if path.endswith((".pkl", ".lock"))]
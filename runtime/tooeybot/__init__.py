@@ -3,3 +3,38 @@ Tooeybot - Autonomous Agent Runtime
 """
 
 __version__ = "0.1.0"
+
+__all__ = [
+    "Agent",
+    "BeliefManager",
+    "MaintenanceManager",
+    "SkillManager",
+    "load_config",
+    "setup_logging",
+]
+
+# Public name -> submodule. Resolved on first access (PEP 562) so that
+# `from tooeybot import Agent` doesn't pull in every other subsystem.
+_LAZY_ATTRS = {
+    "Agent": "agent",
+    "BeliefManager": "beliefs",
+    "MaintenanceManager": "maintenance",
+    "SkillManager": "skills",
+    "load_config": "config",
+    "setup_logging": "logger",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
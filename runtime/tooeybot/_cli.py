@@ -0,0 +1,651 @@
+"""
+Tooeybot command-line interface: argument parsing and command handlers.
+"""
+
+import functools
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+
+DEFAULT_CONFIG = Path("config.yaml")
+
+# Status icons, indexed by a bool: ICONS[ok]
+ICON_OK = "\u2705"
+ICON_FAIL = "\u274c"
+ICONS = (ICON_FAIL, ICON_OK)
+
+
+@functools.cache
+def _maintenance_manager(agent_home: Path):
+    """Return the MaintenanceManager for agent_home, reused within this process."""
+    from .maintenance import MaintenanceManager
+    return MaintenanceManager(agent_home)
+
+
+@functools.cache
+def _skill_manager(agent_home: Path):
+    """Return the SkillManager for agent_home, reused within this process."""
+    from .skills import SkillManager
+    return SkillManager(agent_home)
+
+
+@functools.cache
+def _belief_manager(agent_home: Path):
+    """Return the BeliefManager for agent_home, reused within this process."""
+    from .beliefs import BeliefManager
+    return BeliefManager(agent_home)
+
+
+# --- Core Commands ---
+
+def _cmd_tick(args, config):
+    from .agent import Agent
+    agent = Agent(config)
+    result = agent.tick()
+    return 0 if result.success else 1
+
+
+def _cmd_run(args, config):
+    from .agent import Agent
+    agent = Agent(config)
+    agent.run(interval=args.interval)
+
+
+def _cmd_health(args, config):
+    from .agent import Agent
+    agent = Agent(config)
+    all_ok = True
+    for check, status in agent.iter_health_checks():
+        ok = bool(status["ok"])
+        all_ok &= ok
+        print(f"{ICONS[ok]} {check}: {status['message']}", flush=True)
+    return 0 if all_ok else 1
+
+
+def _cmd_init(args, config):
+    from .agent import Agent
+    agent = Agent(config)
+    agent.initialize()
+    print("Agent filesystem initialized.")
+
+
+# --- Phase 1 Commands ---
+
+def _cmd_summarize(args, config):
+    maintenance = _maintenance_manager(config.agent_home)
+    summary_path = maintenance.write_daily_summary(args.date)
+    print(f"✅ Summary written to: {summary_path}")
+    print("\n" + summary_path.read_text())
+
+
+def _cmd_snapshot(args, config):
+    maintenance = _maintenance_manager(config.agent_home)
+    result = maintenance.create_snapshot(reason=args.reason)
+    if result["success"]:
+        print(f"✅ Snapshot created: {result['commit']} ({result['tag']})")
+    else:
+        print(f"❌ Snapshot failed: {result['error']}")
+        return 1
+
+
+def _cmd_restore(args, config):
+    maintenance = _maintenance_manager(config.agent_home)
+    print(f"⚠️  Restoring to: {args.target}")
+    result = maintenance.restore_snapshot(args.target)
+    if result["success"]:
+        print(f"✅ Restored to: {args.target}")
+    else:
+        print(f"❌ Restore failed: {result['error']}")
+        return 1
+
+
+def _cmd_maintain(args, config):
+    maintenance = _maintenance_manager(config.agent_home)
+    print("Running daily maintenance...")
+    result = maintenance.run_daily_maintenance()
+    
+    print(f"\n📋 Pre-flight checks:")
+    for check, ok in result["preflight"].items():
+        print(f"   {ICONS[bool(ok)]} {check}")
+    
+    print(f"\n📝 Summary: {result['summary'].get('path', result['summary'].get('error', 'N/A'))}")
+    
+    if result["promotion"].get("promoted"):
+        print(f"\n📤 Promoted {len(result['promotion']['promoted'])} items to long-term memory")
+    
+    if result["snapshot"].get("success"):
+        print(f"\n📸 Snapshot: {result['snapshot'].get('commit', 'N/A')}")
+    
+    print(f"\n{'✅ Maintenance complete' if result['success'] else '❌ Maintenance had errors'}")
+    return 0 if result["success"] else 1
+
+
+def _query_pattern(query: str):
+    """Compile a case-insensitive bytes pattern for query, matching UTF-8 text.
+    
+    Bytes IGNORECASE only folds ASCII, so each non-ASCII character is spelled
+    out as an alternation of its encoded upper/lower forms.
+    """
+    import re
+    
+    parts = []
+    for ch in query:
+        if ch.isascii():
+            parts.append(re.escape(ch.encode()))
+        else:
+            variants = sorted({v.encode() for v in (ch, ch.lower(), ch.upper()) if len(v) == 1})
+            parts.append(b"(?:" + b"|".join(re.escape(v) for v in variants) + b")")
+    return re.compile(b"".join(parts), re.IGNORECASE)
+
+
+def _file_contains(path, pattern) -> bool:
+    """Return True if the compiled bytes pattern matches anywhere in the file."""
+    import mmap
+    
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pattern.search(mm) is not None
+        except ValueError:
+            # mmap refuses empty files
+            return False
+
+
+def _cmd_recall(args, config):
+    import os
+    from datetime import date
+    
+    print(f"🔍 Searching for: {args.query}")
+    print(f"   Looking back {args.days} days...\n")
+    
+    pattern = _query_pattern(args.query)
+    
+    found = []
+    today = date.today().toordinal()
+    home = os.fspath(config.agent_home)
+    daily_dir = os.path.join(home, "logs", "daily")
+    dates = [date.fromordinal(today - i).isoformat() for i in range(args.days)]
+    wanted = {f"{day}.md" for day in dates}
+    
+    try:
+        with os.scandir(daily_dir) as it:
+            candidates = {e.name: e.path for e in it if e.name in wanted}
+    except FileNotFoundError:
+        candidates = {}
+    
+    to_scan = [(day, candidates[f"{day}.md"]) for day in dates if f"{day}.md" in candidates]
+    
+    # Files are independent and mmap search releases the GIL; map() keeps date order
+    if to_scan:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(16, len(to_scan))) as pool:
+            matches = pool.map(lambda item: _file_contains(item[1], pattern), to_scan)
+            for (day, path), matched in zip(to_scan, matches):
+                if matched:
+                    found.append((day, path))
+                    print(f"📅 {day}: Found in daily summary")
+    
+    # Also search long-term memory
+    longterm_path = os.path.join(home, "memory", "long_term.md")
+    try:
+        in_longterm = _file_contains(longterm_path, pattern)
+    except FileNotFoundError:
+        in_longterm = False
+    if in_longterm:
+        print(f"📚 Found in long-term memory")
+    
+    if not found:
+        print("No matches found in recent summaries.")
+
+
+# --- Phase 2: Skills Commands ---
+
+def _cmd_skill_list(args, config):
+    skills_mgr = _skill_manager(config.agent_home)
+    skills = skills_mgr.load_skills(status=args.status)
+    
+    if not skills:
+        print(f"No skills found with status: {args.status}")
+        return 0
+    
+    from itertools import groupby
+    from operator import attrgetter
+    
+    all_stats = skills_mgr.get_all_skill_stats(list(skills.values()))
+    
+    # Group by status (in order of first appearance), then by name
+    status_rank = {}
+    for skill in skills.values():
+        status_rank.setdefault(skill.status, len(status_rank))
+    ordered = sorted(skills.values(), key=attrgetter("name"))
+    ordered.sort(key=lambda s: status_rank[s.status])
+    
+    for status, skill_list in groupby(ordered, key=attrgetter("status")):
+        print(f"\n📁 {status.upper()} SKILLS:")
+        for skill in skill_list:
+            stats = all_stats.get(skill.name, {})
+            uses = stats.get("use_count", 0)
+            successes = stats.get("success_count", 0)
+            print(f"   • {skill.name} v{skill.version} (uses: {uses}, success: {successes})")
+            print(f"     {skill.purpose[:60]}...")
+
+
+def _cmd_skill_stats(args, config):
+    skills_mgr = _skill_manager(config.agent_home)
+    stats = skills_mgr.get_skill_stats(args.name)
+    
+    if not stats:
+        print(f"❌ Skill not found: {args.name}")
+        return 1
+    
+    print(f"📊 Skill: {stats['name']}")
+    print(f"   Version: {stats['version']}")
+    print(f"   Status:  {stats['status']}")
+    print(f"   Uses:    {stats['use_count']}")
+    print(f"   Success: {stats['success_count']}")
+    print(f"   Failure: {stats['failure_count']}")
+    if stats.get("last_used"):
+        print(f"   Last used: {stats['last_used']}")
+    if stats.get("ready_for_promotion"):
+        print(f"   ✅ Ready for promotion!")
+
+
+def _cmd_skill_promote(args, config):
+    skills_mgr = _skill_manager(config.agent_home)
+    
+    # Show promotable candidates first
+    promotable = skills_mgr.get_promotable_candidates()
+    if promotable:
+        print("📋 Candidates ready for promotion:")
+        for p in promotable:
+            print(f"   • {p['name']} ({p['success_count']} successful uses)")
+    
+    # Attempt promotion
+    result = skills_mgr.promote_skill(args.name)
+    
+    if result["success"]:
+        print(f"\n✅ Promoted {args.name} to learned skills!")
+    else:
+        print(f"\n❌ Promotion failed: {result['error']}")
+        return 1
+
+
+def _cmd_skill_draft(args, config):
+    skills_mgr = _skill_manager(config.agent_home)
+    
+    skill_path = skills_mgr.draft_skill(
+        name=args.name,
+        purpose=args.purpose,
+        triggers=args.triggers,
+        procedure=args.procedure
+    )
+    
+    print(f"✅ Drafted candidate skill: {args.name}")
+    print(f"   Path: {skill_path}")
+    print("\nNext steps:")
+    print("   1. Edit the skill file to add validation and failure modes")
+    print("   2. Use the skill 3+ times successfully")
+    print("   3. Run 'tooeybot skill-promote {name}' to promote it")
+
+
+# --- Phase 3: Belief Commands ---
+
+def _cmd_belief_list(args, config):
+    belief_mgr = _belief_manager(config.agent_home)
+    
+    if args.status == "all":
+        beliefs = belief_mgr.get_all_beliefs()
+    else:
+        beliefs = belief_mgr.get_all_beliefs(status=args.status)
+    
+    if not beliefs:
+        print(f"No beliefs found with status: {args.status}")
+        return 0
+    
+    from collections import defaultdict
+    
+    # Group by status
+    by_status = defaultdict(list)
+    for belief in beliefs:
+        by_status[belief.status].append(belief)
+    
+    for status, belief_list in by_status.items():
+        print(f"\n📚 {status.upper()} BELIEFS:")
+        for b in belief_list:
+            conf_icon = "🟢" if b.confidence >= 0.8 else "🟡" if b.confidence >= 0.5 else "🔴"
+            print(f"   {conf_icon} {b.belief_id} ({b.confidence:.2f}): {b.claim[:60]}...")
+            if b.contradictions:
+                print(f"      ⚠️ Contradicts: {', '.join(b.contradictions)}")
+
+
+def _cmd_belief_add(args, config):
+    belief_mgr = _belief_manager(config.agent_home)
+    
+    belief = belief_mgr.add_belief(
+        claim=args.claim,
+        confidence=args.confidence,
+        belief_type=args.type,
+        source=args.source or "CLI input"
+    )
+    
+    print(f"✅ Added belief: {belief.belief_id}")
+    print(f"   Claim: {belief.claim}")
+    print(f"   Confidence: {belief.confidence}")
+    print(f"   Type: {belief.belief_type}")
+
+
+def _cmd_belief_contest(args, config):
+    belief_mgr = _belief_manager(config.agent_home)
+    
+    belief = belief_mgr.contest_belief(args.belief_id, args.reason)
+    
+    if belief:
+        print(f"⚠️ Contested belief: {args.belief_id}")
+        print(f"   Reason: {args.reason}")
+    else:
+        print(f"❌ Belief not found: {args.belief_id}")
+        return 1
+
+
+def _cmd_coherence_check(args, config):
+    belief_mgr = _belief_manager(config.agent_home)
+    
+    print("🔍 Running coherence check...")
+    
+    # Create LLM provider for contradiction detection
+    from .llm import create_provider
+    llm = create_provider(config.llm)
+    
+    result = belief_mgr.run_coherence_check(llm_provider=llm)
+    
+    print(f"\n📊 Coherence Check Results:")
+    print(f"   Total beliefs: {result['total_beliefs']}")
+    print(f"   Active: {result['active']}")
+    print(f"   Contested: {result['contested']}")
+    print(f"   Low confidence: {len(result['low_confidence'])}")
+    print(f"   Contradictions: {len(result['potential_contradictions'])}")
+    
+    if result['report_path']:
+        print(f"\n📄 Report: {result['report_path']}")
+    
+    if result['low_confidence']:
+        print(f"\n⚠️ Low confidence beliefs need review:")
+        for b in result['low_confidence'][:5]:
+            print(f"   • {b.belief_id}: {b.claim[:50]}...")
+    
+    if result['potential_contradictions']:
+        print(f"\n❌ Potential contradictions found:")
+        for c in result['potential_contradictions']:
+            print(f"   • {c['belief']} conflicts with {c['conflicts_with']}")
+
+
+# Patterns that indicate operational/procedural beliefs (not world knowledge)
+_PURGE_PATTERNS = (
+    "the agent", "agent's", "agent planned", "agent ran",
+    "was backed up", "was created", "was executed", "was written",
+    "the task", "task completed", "command was", "script reads",
+    "script writes", "embedded python", "planned to", "planned commands",
+    "output contained", "output showed", "response included"
+)
+
+
+def _cmd_belief_purge(args, config):
+    belief_mgr = _belief_manager(config.agent_home)
+    
+    to_purge = belief_mgr.find_matching(_PURGE_PATTERNS, exclude_status="deprecated")
+    
+    if not to_purge:
+        print("✅ No operational beliefs found to purge")
+    else:
+        print(f"🔍 Found {len(to_purge)} operational beliefs:")
+        for belief in to_purge:
+            print(f"   • {belief.belief_id}: {belief.claim[:60]}...")
+        
+        if args.dry_run:
+            print("\n📋 Dry run - no changes made")
+        else:
+            print(f"\n🗑️ Purging {len(to_purge)} beliefs...")
+            with belief_mgr.batch():
+                for belief in to_purge:
+                    belief_mgr.deprecate_belief(belief.belief_id, "Operational log, not world knowledge")
+            print("✅ Done - beliefs deprecated")
+
+
+def _cmd_web(args, config):
+    print(f"🌐 Starting Tooeybot Web UI on http://{args.host}:{args.port}")
+    print(f"   Agent home: {config.agent_home}")
+    print(f"   Press Ctrl+C to stop\n")
+    
+    import uvicorn
+    
+    # uvicorn imports the app from the import string itself
+    uvicorn.run(
+        "tooeybot.web.app:app",
+        host=args.host,
+        port=args.port,
+        reload=args.reload
+    )
+
+
+# --- Batch Command ---
+
+def _cmd_batch(args, config):
+    import shlex
+    
+    # Parse every step up front so a typo doesn't leave a half-run batch.
+    # Steps share the batch's --config and, via the caches above, its managers.
+    steps = []
+    for step in args.steps:
+        step_argv = shlex.split(step)
+        if not step_argv or step_argv[0] == "batch":
+            print(f"{ICON_FAIL} Invalid batch step: {step!r}")
+            return 2
+        # A step's own --config would be ignored, so refuse it outright
+        command = _find_command(step_argv)
+        if command is not None and command != step_argv[0]:
+            build_parser(step_argv).error(
+                f"batch step {step!r}: -c/--config applies to the whole batch; "
+                "pass it before 'batch'"
+            )
+        steps.append((step, _fast_args(step_argv) or build_parser(step_argv).parse_args(step_argv)))
+    
+    for step, step_args in steps:
+        print(f"\n▶️  {step}")
+        code = step_args.func(step_args, config) or 0
+        if code:
+            print(f"{ICON_FAIL} Batch stopped: '{step}' exited with {code}")
+            return code
+    return 0
+
+
+# --- Argument Parsing ---
+
+# Command name -> (handler, help, [(flags, add_argument options), ...]).
+# Only the chosen command is registered when it can be read off argv; help
+# and errors fall back to registering all.
+COMMAND_SPECS = {
+    # Core commands
+    "tick": (_cmd_tick, "Run a single agent tick", []),
+    "run": (_cmd_run, "Run agent continuously", [
+        (("--interval", "-i"), dict(type=int, default=60, help="Seconds between ticks when idle")),
+    ]),
+    "health": (_cmd_health, "Run health checks", []),
+    "init": (_cmd_init, "Initialize agent filesystem", []),
+    
+    # Phase 1 commands
+    "summarize": (_cmd_summarize, "Generate daily summary from events", [
+        (("--date", "-d"), dict(type=str, default=None, help="Date to summarize (YYYY-MM-DD), defaults to today")),
+    ]),
+    "snapshot": (_cmd_snapshot, "Create a git snapshot", [
+        (("--reason", "-r"), dict(type=str, default="manual", help="Reason for snapshot")),
+    ]),
+    "restore": (_cmd_restore, "Restore from a snapshot", [
+        (("target",), dict(type=str, help="Commit hash or tag to restore to")),
+    ]),
+    "maintain": (_cmd_maintain, "Run daily maintenance tasks", []),
+    "recall": (_cmd_recall, "Recall from memory/summaries", [
+        (("query",), dict(type=str, help="What to search for")),
+        (("--days", "-d"), dict(type=int, default=7, help="How many days back to search")),
+    ]),
+    
+    # Phase 2: skills commands
+    "skill-list": (_cmd_skill_list, "List all skills", [
+        (("--status", "-s"), dict(type=str, choices=["core", "learned", "candidate", "all"],
+                                  default="all", help="Filter by status")),
+    ]),
+    "skill-stats": (_cmd_skill_stats, "Show skill statistics", [
+        (("name",), dict(type=str, help="Skill name")),
+    ]),
+    "skill-promote": (_cmd_skill_promote, "Promote a candidate skill", [
+        (("name",), dict(type=str, help="Skill name to promote")),
+    ]),
+    "skill-draft": (_cmd_skill_draft, "Draft a new skill", [
+        (("name",), dict(type=str, help="Skill name")),
+        (("--purpose", "-p"), dict(type=str, required=True, help="What the skill does")),
+        (("--triggers", "-t"), dict(type=str, required=True, help="When to use the skill")),
+        (("--procedure",), dict(type=str, required=True, help="Step-by-step procedure")),
+    ]),
+    
+    # Phase 3: belief commands
+    "belief-list": (_cmd_belief_list, "List all beliefs", [
+        (("--status", "-s"), dict(type=str, choices=["active", "contested", "deprecated", "all"],
+                                  default="all", help="Filter by status")),
+    ]),
+    "belief-add": (_cmd_belief_add, "Add a new belief", [
+        (("claim",), dict(type=str, help="The belief claim")),
+        (("--confidence", "-c"), dict(type=float, default=0.7, help="Confidence level (0.0-1.0)")),
+        (("--type", "-t"), dict(type=str, choices=["observed", "inferred", "external"],
+                                default="external", help="Belief type")),
+        (("--source", "-s"), dict(type=str, default=None, help="Source of the belief")),
+    ]),
+    "belief-contest": (_cmd_belief_contest, "Contest a belief", [
+        (("belief_id",), dict(type=str, help="Belief ID (e.g., B-000001)")),
+        (("--reason", "-r"), dict(type=str, required=True, help="Reason for contesting")),
+    ]),
+    "belief-purge": (_cmd_belief_purge, "Purge operational/bad beliefs", [
+        (("--dry-run",), dict(action="store_true", help="Show what would be purged without actually purging")),
+    ]),
+    "coherence-check": (_cmd_coherence_check, "Run coherence check on beliefs", []),
+    
+    # Several commands in one process
+    "batch": (_cmd_batch, "Run several commands in one process", [
+        (("steps",), dict(nargs="+", metavar="STEP",
+                          help="Command line to run, e.g. summarize 'snapshot -r nightly'")),
+    ]),
+    
+    # Web UI
+    "web": (_cmd_web, "Start web interface", [
+        (("--host", "-H"), dict(type=str, default="0.0.0.0", help="Host to bind to")),
+        (("--port", "-p"), dict(type=int, default=8080, help="Port to listen on")),
+        (("--reload",), dict(action="store_true", help="Enable auto-reload for development")),
+    ]),
+}
+
+
+def _register(subparsers, name: str) -> None:
+    """Add the subparser for one command from COMMAND_SPECS."""
+    handler, help_text, arguments = COMMAND_SPECS[name]
+    command_parser = subparsers.add_parser(name, help=help_text)
+    command_parser.set_defaults(func=handler)
+    for flags, options in arguments:
+        command_parser.add_argument(*flags, **options)
+
+
+def _find_command(argv) -> str:
+    """Return the subcommand name in argv, skipping global options, or None.
+    
+    Any option other than --config before the command (e.g. -h) returns None
+    so the caller falls back to the full parser.
+    """
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-c", "--config"):
+            i += 2
+        elif arg.startswith("--config=") or (arg.startswith("-c") and not arg.startswith("--")):
+            i += 1
+        elif arg.startswith("-"):
+            return None
+        else:
+            return arg
+    return None
+
+
+def build_parser(argv=None) -> "argparse.ArgumentParser":
+    """Build the CLI parser, registering only the subcommand named in argv when possible."""
+    import argparse
+    
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    chosen = _find_command(argv)
+    
+    # Top-level -h/--help can only appear before the command name, i.e. when
+    # no command was found; skip argparse's help machinery otherwise.
+    parser = argparse.ArgumentParser(
+        prog="tooeybot",
+        description="Tooeybot - Autonomous Agent Runtime",
+        add_help=chosen not in COMMAND_SPECS
+    )
+    
+    parser.add_argument(
+        "--config", "-c",
+        type=Path,
+        default=DEFAULT_CONFIG,
+        help="Path to configuration file"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    if chosen in COMMAND_SPECS:
+        _register(subparsers, chosen)
+    else:
+        for name in COMMAND_SPECS:
+            _register(subparsers, name)
+    
+    return parser
+
+
+def _fast_args(argv):
+    """Parse `[-c PATH] COMMAND` for argument-less commands without argparse.
+    
+    Returns None for anything else, including -h, so argparse handles it.
+    """
+    config = DEFAULT_CONFIG
+    if len(argv) == 3 and argv[0] in ("-c", "--config"):
+        config, argv = Path(argv[1]), argv[2:]
+    
+    if len(argv) != 1 or argv[0] not in COMMAND_SPECS:
+        return None
+    
+    handler, _, arguments = COMMAND_SPECS[argv[0]]
+    if arguments:
+        return None
+    return SimpleNamespace(config=config, command=argv[0], func=handler)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    args = _fast_args(argv)
+    if args is None:
+        args = build_parser(argv).parse_args(argv)
+    
+    from .config import load_config
+    from .logger import setup_logging
+    
+    # Load configuration
+    try:
+        config = load_config(args.config)
+    except FileNotFoundError:
+        print(f"Configuration file not found: {args.config}", file=sys.stderr)
+        print("Copy config.example.yaml to config.yaml and adjust settings.", file=sys.stderr)
+        sys.exit(1)
+    
+    # Setup logging
+    setup_logging(config.logging)
+    
+    # Execute command
+    sys.exit(args.func(args, config) or 0)
@@ -0,0 +1,28 @@
+"""
+JSON serialization for the JSONL write path.
+
+Uses orjson when it is installed (it is optional) and the standard library
+otherwise, or for records orjson rejects but json accepts, such as non-str
+dict keys and ints wider than 64 bits. Both produce compact UTF-8 output,
+so files written either way look the same.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_line(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize obj as one JSONL record: UTF-8 bytes ending in a newline."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError
+            pass
+    text = json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
+    return (text + "\n").encode()
@@ -4,33 +4,71 @@ Main agent implementation.
 Phase 2: Cycle-based reasoning with budgets, reflection, and curiosity.
 """
 
-import signal
+import errno
+import os
+import threading
 import time
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator, Tuple, TYPE_CHECKING
 
 from .config import Config
 from .llm import create_provider, Message, LLMProvider
 from .logger import EventLogger
 from .executor import Executor
-from .context import ContextAssembler
+from .context import ContextAssembler, file_sha256
 from .tasks import TaskManager, Task, TaskOrigin
-from .skills import SkillManager
-from .beliefs import BeliefManager
 from .budgets import AgentBudgets, BudgetEnforcer
 from .cycle import (
     ReasoningCycle, CycleState, CycleHistory, CycleResult,
-    Decision, CuriosityProposal
+    Decision, CuriosityProposal, PlanCache
 )
 from .reflection import StuckDetector, ReflectionSynthesizer
-from .curiosity import CuriosityManager
 from .messaging import MessageManager, MessageType, MessagePriority
 
+if TYPE_CHECKING:
+    # Imported where first used, so one-shot commands that never touch
+    # skills, beliefs or curiosity don't load them
+    from .skills import SkillManager
+    from .beliefs import BeliefManager
+    from .curiosity import CuriosityManager
+
 logger = logging.getLogger(__name__)
 
 
+# Directories created by Agent.initialize(), relative to agent_home
+_AGENT_DIRS: Tuple[str, ...] = (
+    "boot",
+    "memory",
+    "memory/archive",
+    "skills/core",
+    "skills/candidates",
+    "skills/learned",
+    "skills/deprecated",
+    "skills/failed",
+    "logs/events",
+    "logs/daily",
+    "logs/weekly",
+    "logs/health",
+    "tasks/completed",
+    "tasks/blocked",
+    "reflection",
+    "snapshots/daily",
+    "snapshots/weekly",
+    "snapshots/monthly",
+    "scratch",
+    "metrics",
+)
+
+# Only the leaves need creating; their parents come along implicitly
+_AGENT_LEAF_DIRS: Tuple[str, ...] = tuple(
+    d for d in _AGENT_DIRS
+    if not any(other.startswith(d + "/") for other in _AGENT_DIRS)
+)
+
+
 @dataclass
 class TickResult:
     """Result of an agent tick."""
@@ -57,23 +95,14 @@ class Agent:
         self.config = config
         self.agent_home = config.agent_home
         self.running = False
+        # Set to cut run()'s idle wait short (by stop() or wake())
+        self._wake_event = threading.Event()
         
-        # Initialize core components
-        self.llm: LLMProvider = create_provider(config.llm)
+        # Core components. The LLM provider, executor, skill/belief managers,
+        # context assembler, curiosity manager and messaging are created on
+        # first use (see the cached properties below) so short-lived commands
+        # such as `health` don't pay for subsystems they never touch.
         self.event_logger = EventLogger(self.agent_home)
-        self.executor = Executor(
-            self.agent_home, 
-            self.event_logger,
-            timeout=config.execution.command_timeout
-        )
-        self.skill_manager = SkillManager(self.agent_home)
-        self.belief_manager = BeliefManager(self.agent_home)
-        self.context = ContextAssembler(
-            self.agent_home,
-            max_tokens=config.context.max_tokens - config.context.response_reserve,
-            skill_manager=self.skill_manager,
-            belief_manager=self.belief_manager
-        )
         self.tasks = TaskManager(self.agent_home)
         
         # Phase 2 components
@@ -89,97 +118,218 @@ class Agent:
             max_curiosity_depth=config.curiosity.max_depth,
             min_curiosity_value_threshold=config.curiosity.min_value_threshold,
         )
-        self.budget_enforcer = BudgetEnforcer(self.budgets, self.agent_home)
+        self.budget_enforcer = BudgetEnforcer(
+            self.budgets,
+            self.agent_home,
+            save_every=config.budgets.state_save_interval,
+        )
         self.cycle_history = CycleHistory(self.agent_home)
         self.stuck_detector = StuckDetector()
         self.reflection_synthesizer = ReflectionSynthesizer()
-        self.curiosity_manager = CuriosityManager(
+        
+        # (monotonic time, stat fingerprint) of the last passing pre-flight,
+        # and monotonic time of the last successful LLM probe
+        self._preflight_cache: Optional[Tuple[float, tuple]] = None
+        self._llm_ok_at: Optional[float] = None
+        # Monotonic time of the last passing pre-flight (see tick())
+        self._last_preflight: Optional[float] = None
+        # (invariants hash, health result) of the last invariants check
+        self._invariants_check: Optional[Tuple[Optional[str], Dict[str, Any]]] = None
+    
+    @cached_property
+    def llm(self) -> LLMProvider:
+        """LLM provider for the configured backend."""
+        return create_provider(self.config.llm)
+    
+    @cached_property
+    def executor(self) -> Executor:
+        """Sandboxed command executor."""
+        return Executor(
+            self.agent_home, 
+            self.event_logger,
+            timeout=self.config.execution.command_timeout,
+            max_output_bytes=self.config.execution.max_output_bytes
+        )
+    
+    @cached_property
+    def skill_manager(self) -> "SkillManager":
+        """Skill library manager."""
+        from .skills import SkillManager
+        return SkillManager(self.agent_home)
+    
+    @cached_property
+    def belief_manager(self) -> "BeliefManager":
+        """Belief store manager."""
+        from .beliefs import BeliefManager
+        return BeliefManager(self.agent_home)
+    
+    @cached_property
+    def context(self) -> ContextAssembler:
+        """Context assembler for LLM calls."""
+        context_config = self.config.context
+        return ContextAssembler(
+            self.agent_home,
+            max_tokens=context_config.max_tokens - context_config.response_reserve,
+            skill_manager=self.skill_manager,
+            belief_manager=self.belief_manager
+        )
+    
+    @cached_property
+    def curiosity_manager(self) -> "CuriosityManager":
+        """Curiosity proposal manager."""
+        from .curiosity import CuriosityManager
+        return CuriosityManager(
             self.agent_home,
             self.budgets,
             self.budget_enforcer
         )
-        
-        # Messaging system
-        self.messaging = MessageManager(self.agent_home)
+    
+    @cached_property
+    def plan_cache(self) -> Optional[PlanCache]:
+        """Plan cache shared across cycles and tasks (None when disabled)."""
+        cache_config = self.config.cache
+        if not cache_config.enabled:
+            return None
+        return PlanCache(
+            max_entries=cache_config.plan_max_entries,
+            ttl_seconds=cache_config.plan_ttl_seconds,
+        )
+    
+    @cached_property
+    def messaging(self) -> MessageManager:
+        """User messaging system."""
+        return MessageManager(self.agent_home)
     
     def initialize(self) -> None:
         """Initialize the agent filesystem if needed."""
-        dirs = [
-            self.agent_home / "boot",
-            self.agent_home / "memory",
-            self.agent_home / "memory" / "archive",
-            self.agent_home / "skills" / "core",
-            self.agent_home / "skills" / "candidates",
-            self.agent_home / "skills" / "learned",
-            self.agent_home / "skills" / "deprecated",
-            self.agent_home / "skills" / "failed",
-            self.agent_home / "logs" / "events",
-            self.agent_home / "logs" / "daily",
-            self.agent_home / "logs" / "weekly",
-            self.agent_home / "logs" / "health",
-            self.agent_home / "tasks" / "completed",
-            self.agent_home / "tasks" / "blocked",
-            self.agent_home / "reflection",
-            self.agent_home / "snapshots" / "daily",
-            self.agent_home / "snapshots" / "weekly",
-            self.agent_home / "snapshots" / "monthly",
-            self.agent_home / "scratch",
-            self.agent_home / "metrics",
-        ]
-        
-        for d in dirs:
-            d.mkdir(parents=True, exist_ok=True)
-        
-        logger.info(f"Initialized agent filesystem at {self.agent_home}")
+        root = os.fspath(self.agent_home)
+        for rel in _AGENT_LEAF_DIRS:
+            path = os.path.join(root, rel)
+            # A single mkdir per leaf on an existing tree; makedirs only
+            # when a parent is missing
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                os.makedirs(path, exist_ok=True)
+        
+        logger.info("Initialized agent filesystem at %s", self.agent_home)
     
     def health_check(self) -> Dict[str, Dict[str, Any]]:
         """Run health checks and return results."""
-        results = {}
-        
+        return dict(self.iter_health_checks())
+    
+    def iter_health_checks(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Run health checks, yielding (name, result) as each one completes."""
         # Check agent home exists
-        results["agent_home"] = {
+        yield "agent_home", {
             "ok": self.agent_home.exists(),
             "message": f"Agent home: {self.agent_home}"
         }
         
         # Check boot files
         boot_files = ["identity.md", "invariants.md", "operating_principles.md"]
-        boot_ok = all((self.agent_home / "boot" / f).exists() for f in boot_files)
-        results["boot_files"] = {
+        boot_ok = set(boot_files).issubset(self._boot_dir_names())
+        yield "boot_files", {
             "ok": boot_ok,
             "message": "Boot files present" if boot_ok else "Missing boot files"
         }
         
         # Check logs writable
         try:
-            test_path = self.agent_home / "logs" / "events" / ".write_test"
-            test_path.write_text("test")
-            test_path.unlink()
-            results["logs_writable"] = {"ok": True, "message": "Logs directory writable"}
+            self._probe_writable(self.agent_home / "logs" / "events")
+            logs_result = {"ok": True, "message": "Logs directory writable"}
         except Exception as e:
-            results["logs_writable"] = {"ok": False, "message": f"Cannot write to logs: {e}"}
+            logs_result = {"ok": False, "message": f"Cannot write to logs: {e}"}
+        yield "logs_writable", logs_result
         
         # Check LLM connectivity
-        llm_ok = self.llm.health_check()
-        results["llm_connection"] = {
+        llm_ok = self._llm_reachable()
+        yield "llm_connection", {
             "ok": llm_ok,
             "message": f"LLM ({self.config.llm.provider}) " + ("reachable" if llm_ok else "unreachable")
         }
         
-        # Check invariants hash
-        inv_hash = self.context.get_invariants_hash()
-        results["invariants"] = {
-            "ok": inv_hash is not None,
-            "message": f"Invariants hash: {inv_hash[:16]}..." if inv_hash else "Cannot read invariants"
-        }
+        # Check invariants hash; the result is reused while the hash is
+        # unchanged. Hashed directly rather than through self.context, which
+        # would load the skill and belief managers
+        inv_hash = file_sha256(self.agent_home / "boot" / "invariants.md")
+        if self._invariants_check is None or self._invariants_check[0] != inv_hash:
+            self._invariants_check = (inv_hash, {
+                "ok": inv_hash is not None,
+                "message": f"Invariants hash: {inv_hash[:16]}..." if inv_hash else "Cannot read invariants"
+            })
+        yield "invariants", self._invariants_check[1]
+    
+    def invalidate_health_cache(self) -> None:
+        """Forget cached pre-flight and LLM probe results so the next tick re-checks."""
+        self._preflight_cache = None
+        self._last_preflight = None
+        self._llm_ok_at = None
+    
+    @staticmethod
+    def _probe_writable(directory: Path) -> None:
+        """Raise OSError unless files can be created in directory.
         
-        return results
+        Opens an unnamed O_TMPFILE where supported, so no directory entry is
+        created; elsewhere falls back to os.access().
+        """
+        if hasattr(os, "O_TMPFILE"):
+            try:
+                os.close(os.open(directory, os.O_TMPFILE | os.O_WRONLY, 0o600))
+                return
+            except OSError as e:
+                # Filesystem without O_TMPFILE support; only access() remains
+                if e.errno not in (errno.EOPNOTSUPP, errno.EISDIR):
+                    raise
+        if not os.access(directory, os.W_OK | os.X_OK):
+            raise PermissionError(errno.EACCES, "Directory not writable", str(directory))
+    
+    def _boot_dir_names(self) -> set:
+        """Names in boot/ from a single directory read (empty if missing)."""
+        try:
+            with os.scandir(self.agent_home / "boot") as entries:
+                return {e.name for e in entries}
+        except OSError:
+            return set()
+    
+    def _llm_reachable(self) -> bool:
+        """Probe the LLM provider, reusing a recent successful probe."""
+        ttl = self.config.execution.llm_health_cache_seconds
+        now = time.monotonic()
+        if self._llm_ok_at is not None and now - self._llm_ok_at < ttl:
+            return True
+        
+        ok = self.llm.health_check()
+        self._llm_ok_at = now if ok else None
+        return ok
+    
+    def _preflight_fingerprint(self) -> Optional[tuple]:
+        """Cheap stat fingerprint of what pre-flight depends on (None if missing)."""
+        try:
+            return tuple(
+                os.stat(p).st_mtime_ns
+                for p in (self.agent_home, self.agent_home / "boot", self.agent_home / "boot" / "invariants.md")
+            )
+        except OSError:
+            return None
     
     def pre_flight_check(self) -> bool:
         """Run pre-flight checks before any operation.
         
-        Auto-initializes the agent filesystem if it doesn't exist.
+        Auto-initializes the agent filesystem if it doesn't exist. A passing
+        result is reused for `execution.preflight_cache_seconds` while the
+        agent home, boot directory and invariants are unchanged.
         """
+        ttl = self.config.execution.preflight_cache_seconds
+        if self._preflight_cache is not None:
+            checked_at, fingerprint = self._preflight_cache
+            if time.monotonic() - checked_at < ttl and fingerprint == self._preflight_fingerprint():
+                self._last_preflight = time.monotonic()
+                return True
+        self._preflight_cache = None
+        
         # Auto-initialize if agent home doesn't exist or is empty
         if not self.agent_home.exists() or not any(self.agent_home.iterdir()):
             logger.info("Agent home missing or empty, initializing...")
@@ -193,23 +343,30 @@ class Agent:
         }
         boot_dir = self.agent_home / "boot"
         boot_dir.mkdir(parents=True, exist_ok=True)
+        present = self._boot_dir_names()
         for fname, content in boot_files.items():
-            fpath = boot_dir / fname
-            if not fpath.exists():
-                fpath.write_text(content)
-                logger.info(f"Created default {fname}")
+            if fname not in present:
+                (boot_dir / fname).write_text(content)
+                logger.info("Created default %s", fname)
         
         results = self.health_check()
         
         # Required checks
-        required = ["agent_home", "boot_files", "logs_writable"]
-        all_ok = all(results.get(k, {}).get("ok", False) for k in required)
-        
-        if not all_ok:
+        required = ("agent_home", "boot_files", "logs_writable")
+        failures = []
+        for k in required:
+            check = results.get(k)
+            if not check or not check.get("ok"):
+                failures.append((k, check.get("message", "unknown") if check else "unknown"))
+        all_ok = not failures
+        
+        if failures:
             logger.error("Pre-flight checks failed")
-            for k in required:
-                if not results.get(k, {}).get("ok", False):
-                    logger.error(f"  - {k}: {results.get(k, {}).get('message', 'unknown')}")
+            for k, message in failures:
+                logger.error("  - %s: %s", k, message)
+        else:
+            self._preflight_cache = (time.monotonic(), self._preflight_fingerprint())
+            self._last_preflight = time.monotonic()
         
         return all_ok
     
@@ -227,8 +384,15 @@ class Agent:
         """
         logger.info("Starting tick (Phase 2 cycle-based)")
         
-        # Pre-flight check
-        if not self.pre_flight_check():
+        # Pre-flight check. Inside run() a passing check is trusted for
+        # execution.preflight_recheck_seconds before it is repeated.
+        recheck = self.config.execution.preflight_recheck_seconds
+        trusted = (
+            self.running
+            and self._last_preflight is not None
+            and time.monotonic() - self._last_preflight < recheck
+        )
+        if not trusted and not self.pre_flight_check():
             return TickResult(
                 success=False,
                 message="Pre-flight checks failed"
@@ -237,7 +401,7 @@ class Agent:
         # Load budget state for recovery
         self.budget_enforcer.load_state()
         
-        # Check for active task first
+        # Check for active task first; the inbox is only read when there is none
         task = self.tasks.get_active_task()
         
         # Check if task is waiting for user response
@@ -245,7 +409,7 @@ class Agent:
             user_reply_content = self._check_for_user_reply(task.task_id)
             
             if user_reply_content is None:
-                logger.info(f"Task {task.task_id} still waiting for user response")
+                logger.info("Task %s still waiting for user response", task.task_id)
                 return TickResult(
                     success=True,
                     task_processed=task.task_id,
@@ -253,7 +417,7 @@ class Agent:
                 )
             
             # User responded, resume the task
-            logger.info(f"User responded, resuming task {task.task_id}")
+            logger.info("User responded, resuming task %s", task.task_id)
             task.status = "active"
             # Add user reply to task context
             task.context = f"{task.context}\n\n## User Reply\n{user_reply_content}" if task.context else f"## User Reply\n{user_reply_content}"
@@ -266,6 +430,8 @@ class Agent:
                 task = pending[0]
                 self.tasks.activate_task(task)
                 self.budgets.reset_for_new_task()
+                # Don't leave the previous task's counters on disk for a restart to load
+                self.budget_enforcer.save_state()
                 self.event_logger.log_task_update(
                     task.task_id, "activated", "Task moved to active"
                 )
@@ -274,8 +440,27 @@ class Agent:
             logger.info("No pending tasks")
             return TickResult(success=True, message="No pending tasks")
         
-        # Run cycles until completion or stop condition
-        return self._run_cycles(task)
+        # Run cycles until completion or stop condition, keeping the task's
+        # history file open for the duration
+        try:
+            with self.cycle_history.append_session(task.task_id):
+                return self._run_cycles(task)
+        except Exception:
+            self.invalidate_health_cache()
+            raise
+        finally:
+            # Persist any debounced budget state, fold journaled belief
+            # updates into beliefs.md, and release the event log handle
+            # held open across the cycles
+            self.budget_enforcer.flush()
+            if "belief_manager" in self.__dict__:
+                self.belief_manager.flush()
+            self.event_logger.close()
+    
+    async def atick(self) -> TickResult:
+        """Run tick() in a worker thread so an event loop stays responsive."""
+        import asyncio
+        return await asyncio.to_thread(self.tick)
     
     def _run_cycles(self, task: Task) -> TickResult:
         """
@@ -283,7 +468,7 @@ class Agent:
         
         This is the core Phase 2 loop that replaces the old _process_task.
         """
-        logger.info(f"Starting cycles for task: {task.task_id}")
+        logger.info("Starting cycles for task: %s", task.task_id)
         
         # Load existing history for this task
         history = self.cycle_history.load_history(task.task_id)
@@ -291,36 +476,44 @@ class Agent:
         cycles_run = 0
         curiosity_tasks_created = 0
         
+        min_interval = self.config.budgets.min_cycle_interval_ms / 1000
+        
+        # One ReasoningCycle per activation; it caches the task-level prompt
+        # parts and runs each cycle against the shared history list
+        cycle = ReasoningCycle(
+            agent=self,
+            task=task,
+            cycle_id=cycle_num + 1,
+            history=history
+        )
+        
         while True:
+            cycle_start = time.monotonic()
             cycle_num += 1
             cycles_run += 1
             
-            logger.info(f"Cycle {cycle_num} for task {task.task_id}")
+            logger.info("Cycle %d for task %s", cycle_num, task.task_id)
             
             # Budget check
             can_continue, reason = self.budget_enforcer.check_can_continue()
             if not can_continue:
-                logger.warning(f"Budget exceeded: {reason}")
+                logger.warning("Budget exceeded: %s", reason)
                 return self._handle_budget_exceeded(task, reason, cycles_run)
             
             # Stuck check
             is_stuck, stuck_reason = self.stuck_detector.is_stuck(history)
             if is_stuck:
-                logger.warning(f"Agent stuck: {stuck_reason}")
+                logger.warning("Agent stuck: %s", stuck_reason)
                 return self._handle_stuck(task, stuck_reason, cycles_run)
             
             # Run one cycle
             try:
-                cycle = ReasoningCycle(
-                    agent=self,
-                    task=task,
-                    cycle_id=cycle_num,
-                    history=history
-                )
-                result = cycle.run()
+                result = cycle.run_next(cycle_num)
             except Exception as e:
-                logger.error(f"Cycle failed: {e}")
+                logger.error("Cycle failed: %s", e)
+                self.invalidate_health_cache()
                 self.budgets.record_iteration(made_progress=False, had_failure=True)
+                self.budget_enforcer.checkpoint()
                 continue
             
             # Persist cycle state
@@ -328,16 +521,8 @@ class Agent:
             self.cycle_history.append_cycle(result.state)
             
             # Update budgets based on reflection
-            made_progress = (
-                result.state.reflection.progress_made 
-                if result.state.reflection else False
-            )
-            had_failure = (
-                not result.state.observation.success 
-                if result.state.observation else False
-            )
-            self.budgets.record_iteration(made_progress, had_failure)
-            self.budget_enforcer.save_state()
+            self.budgets.record_iteration(result.progress, result.had_failure)
+            self.budget_enforcer.checkpoint()
             
             # Log the cycle
             self.event_logger.log_event(
@@ -346,7 +531,7 @@ class Agent:
                     "task_id": task.task_id,
                     "cycle_id": cycle_num,
                     "decision": result.decision.value,
-                    "progress": made_progress,
+                    "progress": result.progress,
                 },
                 level="INFO"
             )
@@ -363,7 +548,7 @@ class Agent:
             # Act on decision
             if result.decision == Decision.COMPLETE:
                 return self._complete_task_with_cycles(
-                    task, result, cycles_run, curiosity_tasks_created
+                    task, result, history, cycles_run, curiosity_tasks_created
                 )
             
             elif result.decision == Decision.BLOCKED:
@@ -381,22 +566,23 @@ class Agent:
                     task, "Budget exceeded", cycles_run
                 )
             
-            # CONTINUE - loop again
-            # Small delay between cycles to be respectful of resources
-            time.sleep(0.5)
+            # CONTINUE - loop again, optionally enforcing a minimum cycle interval
+            remaining = min_interval - (time.monotonic() - cycle_start)
+            if remaining > 0:
+                time.sleep(remaining)
     
     def _complete_task_with_cycles(
         self, 
         task: Task, 
         result: CycleResult,
+        history: List[CycleState],
         cycles_run: int,
         curiosity_tasks_created: int
     ) -> TickResult:
         """Complete a task after cycle-based processing."""
         summary = result.summary or "Task completed"
         
-        # Build approach from cycle history
-        history = self.cycle_history.load_history(task.task_id)
+        # Build approach from the in-memory cycle history
         approach_lines = []
         for cycle in history[-10:]:  # Last 10 cycles
             if cycle.action:
@@ -493,12 +679,13 @@ class Agent:
         full_reason = f"Budget exceeded: {reason}"
         
         self.tasks.pause_task(task, full_reason)
-        self.event_logger.log_task_update(task.task_id, "paused", full_reason)
-        self.event_logger.log_event(
-            "budget_exceeded",
-            {"task_id": task.task_id, "reason": reason},
-            level="WARNING"
-        )
+        self.event_logger.log_batch([
+            self.event_logger.task_update_event(task.task_id, "paused", full_reason),
+            self.event_logger.generic_event(
+                "budget_exceeded",
+                {"task_id": task.task_id, "reason": reason}
+            ),
+        ])
         
         return TickResult(
             success=True,
@@ -518,12 +705,13 @@ class Agent:
         full_reason = f"Agent stuck: {reason}"
         
         self.tasks.pause_task(task, full_reason)
-        self.event_logger.log_task_update(task.task_id, "paused", full_reason)
-        self.event_logger.log_event(
-            "stuck_detected",
-            {"task_id": task.task_id, "reason": reason},
-            level="WARNING"
-        )
+        self.event_logger.log_batch([
+            self.event_logger.task_update_event(task.task_id, "paused", full_reason),
+            self.event_logger.generic_event(
+                "stuck_detected",
+                {"task_id": task.task_id, "reason": reason}
+            ),
+        ])
         
         return TickResult(
             success=True,
@@ -535,15 +723,16 @@ class Agent:
     
     def get_cycle_status(self, task_id: str) -> Dict[str, Any]:
         """Get status of cycles for a task."""
-        history = self.cycle_history.load_history(task_id)
+        # The summary's recent window covers what the stuck indicators inspect
+        count, recent = self.cycle_history.load_summary(task_id)
         budget_status = self.budget_enforcer.get_status_summary()
         
         return {
             "task_id": task_id,
-            "cycles": len(history),
-            "last_cycle": history[-1].to_dict() if history else None,
+            "cycles": count,
+            "last_cycle": recent[-1].to_dict() if recent else None,
             "budgets": budget_status,
-            "stuck_indicators": self.stuck_detector.get_stuck_indicators(history),
+            "stuck_indicators": self.stuck_detector.get_stuck_indicators(recent),
         }
     
     def get_curiosity_stats(self) -> Dict[str, Any]:
@@ -571,7 +760,7 @@ class Agent:
                 },
                 level="INFO"
             )
-            logger.info(f"Received user message: {msg.subject}")
+            logger.info("Received user message: %s", msg.subject)
             
             # Collect reply content
             reply_parts.append(f"**{msg.message_type.value}**: {msg.body}")
@@ -598,7 +787,7 @@ class Agent:
         """
         # First check for unread messages from user
         pending_messages = self.messaging.get_unread_for_agent()
-        logger.info(f"Checking for reply: {len(pending_messages)} unread user messages")
+        logger.info("Checking for reply: %d unread user messages", len(pending_messages))
         
         if pending_messages:
             # Process and return the reply content
@@ -607,7 +796,7 @@ class Agent:
         # If no unread messages, check if there are threads waiting for agent
         # (this means user replied but the message may have been viewed in UI)
         threads_waiting = self.messaging.get_threads_waiting_agent()
-        logger.info(f"Threads waiting for agent: {len(threads_waiting)}")
+        logger.info("Threads waiting for agent: %d", len(threads_waiting))
         
         if threads_waiting:
             # Find threads related to this task
@@ -618,7 +807,7 @@ class Agent:
                     user_messages = [m for m in thread_messages if m.sender.value == "user"]
                     if user_messages:
                         latest = user_messages[-1]  # Last message in thread
-                        logger.info(f"Found user reply in thread {thread.id}: {latest.subject}")
+                        logger.info("Found user reply in thread %s: %s", thread.id, latest.subject)
                         
                         # Update thread status
                         threads = self.messaging._load_threads()
@@ -666,7 +855,7 @@ class Agent:
             level="INFO"
         )
         
-        logger.info(f"Asked user: {question[:100]}")
+        logger.info("Asked user: %s", question[:100])
         return msg.id
     
     def send_status(
@@ -703,22 +892,76 @@ class Agent:
         """Get messaging statistics."""
         return self.messaging.get_stats()
 
+    def stop(self) -> None:
+        """Ask a running run() loop to exit, interrupting any idle wait."""
+        self.running = False
+        self._wake_event.set()
+    
+    def wake(self) -> None:
+        """End run()'s current idle wait early, e.g. when a task was queued."""
+        self._wake_event.set()
+    
+    def _inbox_signature(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the task inbox, or None if it doesn't exist."""
+        try:
+            st = os.stat(self.tasks.inbox_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _idle_wait(self, interval: float) -> bool:
+        """
+        Wait up to `interval` seconds between ticks.
+        
+        Returns early (True) on stop()/wake() or, when
+        `execution.inbox_poll_seconds` is set, as soon as the task inbox
+        changes, so tasks queued by another process are picked up promptly.
+        """
+        poll = self.config.execution.inbox_poll_seconds
+        if poll <= 0:
+            return self._wake_event.wait(interval)
+        
+        deadline = time.monotonic() + interval
+        signature = self._inbox_signature()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._wake_event.wait(min(poll, remaining)):
+                return True
+            if self._inbox_signature() != signature:
+                logger.debug("Task inbox changed, waking early")
+                return True
+    
     def run(self, interval: int = 60) -> None:
         """Run the agent continuously."""
+        import signal
+        
         self.running = True
+        self._wake_event.clear()
         
         # Handle signals for graceful shutdown
         def signal_handler(signum, frame):
             logger.info("Received shutdown signal")
-            self.running = False
+            self.stop()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # Signal handlers can only be installed from the main thread; agents
+        # run from other threads are stopped with stop() instead.
+        previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                previous_handlers[signum] = signal.signal(signum, signal_handler)
+        else:
+            logger.debug("Not in main thread, skipping signal handler registration")
         
         # Log startup
         self.event_logger.log_startup()
         logger.info("Agent started in continuous mode")
         
+        # Pre-flight once up front; ticks then only re-check periodically
+        if not self.pre_flight_check():
+            logger.warning("Pre-flight failed at startup, retrying on each tick")
+        
         try:
             while self.running:
                 result = self.tick()
@@ -727,10 +970,14 @@ class Agent:
                     # If we processed a task, immediately check for more
                     continue
                 else:
-                    # No work, wait before next tick
-                    logger.debug(f"Idle, sleeping for {interval}s")
-                    time.sleep(interval)
+                    # No work, wait before next tick (stop() or wake() ends the wait)
+                    logger.debug("Idle, sleeping for %ss", interval)
+                    if self._idle_wait(interval):
+                        self._wake_event.clear()
         
         finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
             self.event_logger.log_shutdown()
+            self.event_logger.close()
             logger.info("Agent stopped")
@@ -6,18 +6,79 @@ and contradiction detection. Beliefs are actively updated during
 task execution based on observations and outcomes.
 """
 
+import fcntl
+import functools
+import hashlib
 import json
+import os
+import pickle
 import re
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Belief markdown fields (see Belief.to_markdown)
+_ID_RE = re.compile(r'^## (B-\d+)', re.MULTILINE)
+_CLAIM_RE = re.compile(r'\*\*Claim\*\*:\s*(.+)', re.MULTILINE)
+_CONF_RE = re.compile(r'\*\*Confidence\*\*:\s*([\d.]+)', re.MULTILINE)
+_STATUS_RE = re.compile(r'\*\*Status\*\*:\s*(\w+)', re.MULTILINE)
+_TYPE_RE = re.compile(r'\*\*Type\*\*:\s*([\w-]+)', re.MULTILINE)
+_VALIDATED_RE = re.compile(r'\*\*Last_validated\*\*:\s*(.+)', re.MULTILINE)
+_NOTES_RE = re.compile(r'\*\*Notes\*\*:\s*(.+)', re.MULTILINE)
+_CONTRA_RE = re.compile(r'\*\*Contradictions\*\*:\s*(.+)', re.MULTILINE)
+_PROV_RE = re.compile(r'\*\*Provenance\*\*:\s*\n((?:\s+-[^\n]+\n?)+)')
 
-@dataclass
+# beliefs.md / journal structure
+_SPLIT_RE = re.compile(r'\n---\n')
+_JOURNAL_SEP = "\n---\n\n"
+_NEXT_ID_RE = re.compile(r'\*Next belief ID:\s*B-(\d+)\*')
+_BELIEFS_HEADER = """# Beliefs
+
+Structured claims with provenance and confidence tracking.
+
+---
+
+"""
+
+# LLM responses
+_CONTRADICTS_RE = re.compile(r'CONTRADICTS:\s*(B-\d+)')
+_OBSERVATION_RE = re.compile(r'OBSERVATION:\s*(.+?)\nCONFIDENCE:\s*([\d.]+)\nTYPE:\s*(\w+)', re.MULTILINE)
+
+# System prompts are module constants so every call reuses one shared
+# Message (see llm.system_message)
+_CONTRADICTION_SYSTEM_PROMPT = "You analyze claims for logical contradictions. Be precise and concise."
+
+_EXTRACTION_SYSTEM_PROMPT = """You extract meaningful BELIEFS from task outcomes.
+
+A BELIEF is something the agent should remember about the world, its capabilities, 
+or its environment that will help with future tasks. 
+
+GOOD beliefs (extract these):
+- "The backup directory /mnt/backups has 50GB free space"
+- "Python 3.11 is installed at /usr/bin/python3"  
+- "The config file uses YAML format, not JSON"
+- "Git commits require --signoff flag in this repository"
+- "The API rate limit is 100 requests per minute"
+
+BAD beliefs (DO NOT extract):
+- "The agent ran command X" (this is a log, not a belief)
+- "The task completed successfully" (this is task status)
+- "The agent planned to do X then Y" (this is procedure, not belief)
+- "The output contained X lines" (this is ephemeral data)
+- "File X was backed up to Y" (this is action taken, not world knowledge)
+
+Only extract beliefs that would help the agent make better decisions in FUTURE tasks.
+If the task outcome doesn't reveal any meaningful world knowledge, say NO_OBSERVATIONS."""
+
+
+@dataclass(slots=True)
 class Belief:
     """A structured claim with provenance and confidence."""
     belief_id: str  # B-000001 format
@@ -57,33 +118,34 @@ class Belief:
         """Parse a belief from markdown block."""
         try:
             # Extract belief ID
-            id_match = re.search(r'^## (B-\d+)', text, re.MULTILINE)
+            id_match = _ID_RE.search(text)
             if not id_match:
                 return None
             belief_id = id_match.group(1)
             
             # Extract fields
-            def extract(pattern: str, default: str = "") -> str:
-                match = re.search(pattern, text, re.MULTILINE)
+            def extract(pattern: re.Pattern, default: str = "") -> str:
+                match = pattern.search(text)
                 return match.group(1).strip() if match else default
             
-            claim = extract(r'\*\*Claim\*\*:\s*(.+)')
-            confidence = float(extract(r'\*\*Confidence\*\*:\s*([\d.]+)', "0.5"))
-            status = extract(r'\*\*Status\*\*:\s*(\w+)', "active")
-            belief_type = extract(r'\*\*Type\*\*:\s*([\w-]+)', "inferred")
-            last_validated = extract(r'\*\*Last_validated\*\*:\s*(.+)', 
-                                    datetime.now().strftime("%Y-%m-%d"))
-            notes = extract(r'\*\*Notes\*\*:\s*(.+)', "")
+            claim = extract(_CLAIM_RE)
+            confidence = float(extract(_CONF_RE, "0.5"))
+            status = extract(_STATUS_RE, "active")
+            belief_type = extract(_TYPE_RE, "inferred")
+            last_validated = extract(_VALIDATED_RE, None)
+            if last_validated is None:
+                last_validated = _today()
+            notes = extract(_NOTES_RE, "")
             
             # Extract contradictions
-            contradictions_str = extract(r'\*\*Contradictions\*\*:\s*(.+)', "None")
+            contradictions_str = extract(_CONTRA_RE, "None")
             contradictions = []
             if contradictions_str and contradictions_str != "None":
                 contradictions = [c.strip() for c in contradictions_str.split(",")]
             
             # Extract provenance (simplified)
             provenance = []
-            prov_match = re.search(r'\*\*Provenance\*\*:\s*\n((?:\s+-[^\n]+\n?)+)', text)
+            prov_match = _PROV_RE.search(text)
             if prov_match:
                 for line in prov_match.group(1).split("\n"):
                     if "Source:" in line:
@@ -106,60 +168,398 @@ class Belief:
             return None
 
 
+@functools.lru_cache(maxsize=32)
+def _phrase_matcher(phrases: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile phrases into a single alternation regex (None if empty)."""
+    if not phrases:
+        return None
+    return re.compile("|".join(re.escape(p) for p in phrases))
+
+
+# [start, end) of the cached local day as epoch seconds, and its date string
+_today_cache = [0.0, 0.0, ""]
+
+
+def _cache_base(agent_home: Path) -> Path:
+    """Per-home path prefix for the belief snapshot and lock files.
+    
+    They live outside the agent home, which snapshots commit wholesale.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha256(str(Path(agent_home).resolve()).encode()).hexdigest()[:16]
+    return Path(base) / "tooeybot" / f"beliefs-{digest}"
+
+
+def _today() -> str:
+    """Local date as YYYY-MM-DD, formatted once per day."""
+    now = time.time()
+    if not _today_cache[0] <= now < _today_cache[1]:
+        start = datetime.combine(datetime.fromtimestamp(now).date(), datetime.min.time())
+        _today_cache[0] = start.timestamp()
+        _today_cache[1] = (start + timedelta(days=1)).timestamp()
+        _today_cache[2] = start.strftime("%Y-%m-%d")
+    return _today_cache[2]
+
+
 class BeliefManager:
-    """Manages the belief system with active updates."""
+    """Manages the belief system with active updates.
+    
+    Mutations append the changed belief to a journal next to beliefs.md;
+    compact() folds the journal back into beliefs.md. Both files are only
+    touched under an flock on a per-home lock file in the user cache
+    directory, so several processes (agent, CLI, web UI) can share them.
+    """
+    
+    # Journal entries after which beliefs.md is rewritten
+    COMPACT_EVERY = 64
+    
+    # Closest-belief similarity below which the LLM contradiction check is skipped
+    CONTRADICTION_MIN_SIMILARITY = 0.5
+    
+    # LLM contradiction verdicts remembered per (claim, candidate beliefs);
+    # run_coherence_check keeps them across runs in logs/health/
+    CONTRADICTION_CACHE_SIZE = 128
     
     def __init__(self, agent_home: Path):
         self.agent_home = agent_home
         self.beliefs_file = agent_home / "memory" / "beliefs.md"
+        self.journal_file = agent_home / "memory" / "beliefs.journal.md"
+        cache_base = _cache_base(agent_home)
+        self.snapshot_file = cache_base.with_name(cache_base.name + ".pkl")
+        self.verdicts_file = agent_home / "logs" / "health" / "contradiction_verdicts.json"
+        self.lock_file = cache_base.with_name(cache_base.name + ".lock")
+        self.beliefs_file.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Earlier versions kept both inside memory/, where snapshots picked them up
+        for stale in (".beliefs.cache.pkl", ".beliefs.lock"):
+            (self.beliefs_file.parent / stale).unlink(missing_ok=True)
         self._beliefs_cache: Dict[str, Belief] = {}
+        # Lowercased claim words per belief, and word -> IDs of beliefs using it
+        self._token_sets: Dict[str, frozenset] = {}
+        self._inverted: Dict[str, Set[str]] = defaultdict(set)
         self._next_id: int = 1
+        self._journal_entries = 0
+        # (mtime_ns, size) of beliefs.md as loaded, () if absent; and how many
+        # journal bytes have been replayed on top of it
+        self._disk_key: Optional[tuple] = None
+        self._journal_offset = 0
+        self._lock_depth = 0
+        # Beliefs changed inside batch(), written when the outermost batch exits
+        self._dirty: Dict[str, None] = {}
+        # Dirty beliefs added (not just changed) here; their IDs may also
+        # have been taken by another process and are renumbered if so
+        self._new_ids: Set[str] = set()
+        self._batch_depth = 0
+        self._contradiction_cache: "OrderedDict[str, str]" = OrderedDict()
         self._load_beliefs()
     
     def _load_beliefs(self) -> None:
-        """Load all beliefs from beliefs.md."""
-        if not self.beliefs_file.exists():
+        """Load all beliefs from beliefs.md, then replay the journal."""
+        with self._locked():
+            self._sync()
+        
+        logger.debug(f"Loaded {len(self._beliefs_cache)} beliefs, next ID: B-{self._next_id:06d}")
+    
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the cross-process lock on beliefs.md and the journal (reentrant)."""
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
             return
         
-        content = self.beliefs_file.read_text()
+        with open(self.lock_file, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            self._lock_depth = 1
+            try:
+                yield
+            finally:
+                self._lock_depth = 0
+                fcntl.flock(f, fcntl.LOCK_UN)
+    
+    def _sync(self) -> None:
+        """Catch up with beliefs.md and the journal; call with the lock held.
+        
+        beliefs.md is (re)loaded when it differs from what was last loaded,
+        i.e. on first use or after another process compacted; it is read
+        from the pickled snapshot while that matches its mtime and size.
+        Journal entries not yet seen are then replayed on top.
+        """
+        try:
+            st = os.stat(self.beliefs_file)
+            key = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            key = ()
+        
+        if key != self._disk_key:
+            # Changes not yet journaled (inside batch()) survive the reload
+            pending = [self._beliefs_cache[b] for b in self._dirty if b in self._beliefs_cache]
+            self._beliefs_cache.clear()
+            self._token_sets.clear()
+            self._inverted.clear()
+            if key:
+                if not self._read_snapshot(key):
+                    self._load_blocks(self.beliefs_file.read_text())
+                    self._write_snapshot(key)
+            for belief in pending:
+                if belief.belief_id in self._new_ids and belief.belief_id in self._beliefs_cache:
+                    self._renumber(belief)
+                self._beliefs_cache[belief.belief_id] = belief
+                self._index_belief(belief)
+            self._disk_key = key
+            self._journal_offset = 0
+            self._journal_entries = 0
+        
+        self._replay_journal()
+    
+    def _replay_journal(self) -> None:
+        """Apply complete journal entries written since the last replay."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        
+        # A writer without the lock may be mid-append; stop at the last
+        # complete entry
+        end = data.rfind(_JOURNAL_SEP.encode())
+        if end < 0:
+            return
+        end += len(_JOURNAL_SEP)
+        self._journal_offset += end
+        
+        # Only each belief's latest entry matters
+        latest: Dict[str, str] = {}
+        for block in _SPLIT_RE.split(data[:end].decode()):
+            match = _ID_RE.search(block)
+            if match and block.strip().startswith("## B-"):
+                latest[match.group(1)] = block
+                self._journal_entries += 1
+        
+        for belief_id in latest:
+            self._track_id(belief_id)
+        
+        for belief_id, block in latest.items():
+            if belief_id in self._new_ids:
+                # Another process added a belief under the ID given to one
+                # of ours that isn't journaled yet
+                self._renumber(self._beliefs_cache[belief_id])
+            elif belief_id in self._dirty:
+                continue
+            # Entries this process wrote match memory already; keep those
+            # objects rather than re-parsing them
+            current = self._beliefs_cache.get(belief_id)
+            if current is not None and current.to_markdown().strip() == block.strip():
+                continue
+            belief = Belief.from_markdown(block)
+            if belief:
+                self._beliefs_cache[belief_id] = belief
+                self._index_belief(belief)
+    
+    def _renumber(self, belief: Belief) -> None:
+        """Give an unjournaled new belief a fresh ID, freeing its old one."""
+        old_id = belief.belief_id
+        self._new_ids.discard(old_id)
+        self._dirty.pop(old_id, None)
+        if self._beliefs_cache.get(old_id) is belief:
+            del self._beliefs_cache[old_id]
+            self._unindex(old_id)
+        
+        belief.belief_id = self._generate_id()
+        self._new_ids.add(belief.belief_id)
+        self._dirty[belief.belief_id] = None
+        self._beliefs_cache[belief.belief_id] = belief
+        self._index_belief(belief)
+        logger.info(f"Renumbered belief {old_id} to {belief.belief_id} (ID taken by another process)")
+    
+    def _load_blocks(self, content: str) -> int:
+        """Load belief blocks from content; later blocks replace earlier ones.
+        
+        Returns the number of beliefs read.
+        """
+        count = 0
+        last_id = None
+        
+        # _save_beliefs writes beliefs in ID order followed by a "Next belief
+        # ID" marker; with the marker present only the last ID needs checking,
+        # otherwise (journal, hand-written files) every ID is
+        next_match = _NEXT_ID_RE.search(content)
         
         # Split into belief blocks
-        blocks = re.split(r'\n---\n', content)
+        blocks = _SPLIT_RE.split(content)
         
+        parse = Belief.from_markdown
         for block in blocks:
             if block.strip().startswith("## B-"):
-                belief = Belief.from_markdown(block)
+                belief = parse(block)
                 if belief:
                     self._beliefs_cache[belief.belief_id] = belief
-                    # Track next ID
-                    num = int(belief.belief_id.split("-")[1])
-                    if num >= self._next_id:
-                        self._next_id = num + 1
+                    self._index_belief(belief)
+                    count += 1
+                    last_id = belief.belief_id
+                    if next_match is None:
+                        self._track_id(last_id)
         
-        # Also check for "Next belief ID" marker
-        next_match = re.search(r'\*Next belief ID:\s*B-(\d+)\*', content)
         if next_match:
             self._next_id = max(self._next_id, int(next_match.group(1)))
+            if last_id is not None:
+                self._track_id(last_id)
         
-        logger.debug(f"Loaded {len(self._beliefs_cache)} beliefs, next ID: B-{self._next_id:06d}")
+        return count
+    
+    def _read_snapshot(self, key: Tuple[int, int]) -> bool:
+        """Load beliefs.md's contents from the snapshot if it was taken at key."""
+        try:
+            with open(self.snapshot_file, "rb") as f:
+                cached_key, beliefs, next_id = pickle.load(f)
+        except Exception:
+            return False
+        if cached_key != key:
+            return False
+        
+        self._beliefs_cache.update(beliefs)
+        for belief in beliefs.values():
+            self._index_belief(belief)
+        self._next_id = max(self._next_id, next_id)
+        return True
+    
+    def _write_snapshot(self, key: Tuple[int, int]) -> None:
+        """Pickle the in-memory beliefs as the state of beliefs.md at key.
+        
+        Only called when memory matches beliefs.md. Best-effort: a failure
+        just means parsing markdown next time.
+        """
+        tmp_path = self.snapshot_file.with_name(self.snapshot_file.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((key, self._beliefs_cache, self._next_id), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_file)
+        except Exception as e:
+            logger.debug(f"Could not write belief snapshot: {e}")
+    
+    def _track_id(self, belief_id: str) -> None:
+        """Keep _next_id above an ID seen on disk."""
+        num = int(belief_id[2:])
+        if num >= self._next_id:
+            self._next_id = num + 1
+    
+    def _index_belief(self, belief: Belief) -> None:
+        """Update the claim word index for a loaded, added or changed belief."""
+        tokens = frozenset(belief.claim.lower().split())
+        old = self._token_sets.get(belief.belief_id)
+        if old == tokens:
+            return
+        if old:
+            for token in old - tokens:
+                postings = self._inverted[token]
+                postings.discard(belief.belief_id)
+                if not postings:
+                    del self._inverted[token]
+        for token in tokens if old is None else tokens - old:
+            self._inverted[token].add(belief.belief_id)
+        self._token_sets[belief.belief_id] = tokens
+    
+    def _unindex(self, belief_id: str) -> None:
+        """Remove a belief from the claim word index."""
+        for token in self._token_sets.pop(belief_id, ()):
+            postings = self._inverted[token]
+            postings.discard(belief_id)
+            if not postings:
+                del self._inverted[token]
+    
+    def _append_belief(self, belief: Belief) -> None:
+        """Journal an added or changed belief (deferred inside batch())."""
+        self._index_belief(belief)
+        self._dirty[belief.belief_id] = None
+        if not self._batch_depth:
+            self._write_dirty()
+    
+    def _write_dirty(self) -> None:
+        """Journal every dirty belief in one write, compacting every COMPACT_EVERY entries."""
+        if not self._dirty:
+            return
+        with self._locked():
+            # Catch up first so new beliefs can't reuse an ID taken meanwhile
+            self._sync()
+            data = "".join(
+                self._beliefs_cache[belief_id].to_markdown() + _JOURNAL_SEP
+                for belief_id in self._dirty
+                if belief_id in self._beliefs_cache
+            )
+            with open(self.journal_file, "a") as f:
+                f.write(data)
+            self._dirty.clear()
+            self._new_ids.clear()
+            # Replays (and counts) the entries just written
+            self._sync()
+            
+            if self._journal_entries >= self.COMPACT_EVERY:
+                self.compact()
+    
+    @contextmanager
+    def batch(self) -> Iterator["BeliefManager"]:
+        """Coalesce updates: each belief changed inside is journaled once, on exit."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._write_dirty()
+    
+    def compact(self) -> None:
+        """Fold the journal into beliefs.md.
+        
+        Under the lock, catches up with the journal, rewrites beliefs.md and
+        removes only the journal bytes that were replayed.
+        """
+        self._write_dirty()
+        with self._locked():
+            self._sync()
+            self._save_beliefs()
+            try:
+                with open(self.journal_file, "r+b") as f:
+                    f.seek(self._journal_offset)
+                    tail = f.read()
+                    f.seek(0)
+                    f.write(tail)
+                    f.truncate()
+            except FileNotFoundError:
+                pass
+            self._journal_offset = 0
+            self._journal_entries = 0
+    
+    def flush(self) -> None:
+        """Write pending updates and compact if anything has been journaled."""
+        self._write_dirty()
+        if self._journal_entries:
+            self.compact()
     
     def _save_beliefs(self) -> None:
-        """Save all beliefs to beliefs.md."""
-        content = """# Beliefs
-
-Structured claims with provenance and confidence tracking.
-
----
-
-"""
+        """Save all beliefs to beliefs.md (atomically, synced to disk)."""
+        parts = [_BELIEFS_HEADER]
         # Sort by ID
         for belief_id in sorted(self._beliefs_cache.keys()):
-            belief = self._beliefs_cache[belief_id]
-            content += belief.to_markdown() + "\n---\n\n"
+            parts.append(self._beliefs_cache[belief_id].to_markdown())
+            parts.append("\n---\n\n")
         
-        content += f"*Next belief ID: B-{self._next_id:06d}*\n"
+        parts.append(f"*Next belief ID: B-{self._next_id:06d}*\n")
+        content = "".join(parts)
         
-        self.beliefs_file.write_text(content)
+        tmp_path = self.beliefs_file.with_name(self.beliefs_file.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.beliefs_file)
+        
+        st = os.stat(self.beliefs_file)
+        self._disk_key = (st.st_mtime_ns, st.st_size)
+        self._write_snapshot(self._disk_key)
         logger.debug(f"Saved {len(self._beliefs_cache)} beliefs")
     
     def _generate_id(self) -> str:
@@ -183,6 +583,17 @@ Structured claims with provenance and confidence tracking.
             beliefs = [b for b in beliefs if b.status == status]
         return sorted(beliefs, key=lambda b: b.belief_id)
     
+    def find_matching(self, patterns: List[str], exclude_status: str = None) -> List[Belief]:
+        """Get beliefs whose claim contains any of the (lowercase) phrases."""
+        matcher = _phrase_matcher(tuple(patterns))
+        if matcher is None:
+            return []
+        
+        return [
+            b for b in self.get_all_beliefs()
+            if b.status != exclude_status and matcher.search(b.claim.lower())
+        ]
+    
     def add_belief(
         self,
         claim: str,
@@ -209,15 +620,16 @@ Structured claims with provenance and confidence tracking.
             status="active",
             belief_type=belief_type,
             provenance=provenance,
-            last_validated=datetime.now().strftime("%Y-%m-%d"),
+            last_validated=_today(),
             contradictions=[],
             notes=notes
         )
         
         self._beliefs_cache[belief_id] = belief
-        self._save_beliefs()
+        self._new_ids.add(belief_id)
+        self._append_belief(belief)
         
-        logger.info(f"Added belief {belief_id}: {claim[:50]}...")
+        logger.info(f"Added belief {belief.belief_id}: {claim[:50]}...")
         return belief
     
     def update_confidence(self, belief_id: str, delta: float, reason: str = "") -> Optional[Belief]:
@@ -228,15 +640,25 @@ Structured claims with provenance and confidence tracking.
         
         old_confidence = belief.confidence
         belief.confidence = max(0.0, min(1.0, belief.confidence + delta))
-        belief.last_validated = datetime.now().strftime("%Y-%m-%d")
+        belief.last_validated = _today()
         
         if reason:
             belief.notes = f"{reason} (was {old_confidence:.2f})"
         
-        self._save_beliefs()
+        self._append_belief(belief)
         logger.info(f"Updated {belief_id} confidence: {old_confidence:.2f} → {belief.confidence:.2f}")
         return belief
     
+    def update_confidence_many(self, deltas: Dict[str, float], reason: str = "") -> List[Belief]:
+        """Apply confidence deltas to several beliefs, journaled in one write."""
+        updated = []
+        with self.batch():
+            for belief_id, delta in deltas.items():
+                belief = self.update_confidence(belief_id, delta, reason)
+                if belief:
+                    updated.append(belief)
+        return updated
+    
     def contest_belief(self, belief_id: str, reason: str, contradicting_id: str = None) -> Optional[Belief]:
         """Mark a belief as contested."""
         belief = self.get_belief(belief_id)
@@ -250,7 +672,7 @@ Structured claims with provenance and confidence tracking.
             if contradicting_id not in belief.contradictions:
                 belief.contradictions.append(contradicting_id)
         
-        self._save_beliefs()
+        self._append_belief(belief)
         logger.info(f"Contested belief {belief_id}")
         return belief
     
@@ -263,7 +685,7 @@ Structured claims with provenance and confidence tracking.
         belief.status = "deprecated"
         belief.notes = f"Deprecated: {reason}"
         
-        self._save_beliefs()
+        self._append_belief(belief)
         logger.info(f"Deprecated belief {belief_id}")
         return belief
     
@@ -271,25 +693,43 @@ Structured claims with provenance and confidence tracking.
     # Contradiction Detection
     # =========================================================================
     
-    def find_similar_beliefs(self, claim: str, threshold: float = 0.5) -> List[Tuple[Belief, float]]:
+    def find_similar_beliefs(
+        self,
+        claim: str,
+        threshold: float = 0.5,
+        exclude_id: Optional[str] = None
+    ) -> List[Tuple[Belief, float]]:
         """
         Find beliefs that might be related to a claim.
         Returns list of (belief, similarity_score) tuples.
         
-        Uses simple keyword overlap for now.
+        Uses simple keyword overlap (Jaccard similarity of claim words).
+        Only beliefs sharing a word with the claim are scored, via the
+        inverted index; with threshold <= 0 every belief qualifies.
+        The belief `exclude_id` (usually the claim's own) is never returned.
         """
-        claim_words = set(claim.lower().split())
-        results = []
+        claim_words = frozenset(claim.lower().split())
         
-        for belief in self._beliefs_cache.values():
+        if threshold > 0:
+            candidates = set()
+            for word in claim_words:
+                candidates.update(self._inverted.get(word, ()))
+        else:
+            candidates = self._beliefs_cache.keys()
+        
+        results = []
+        for belief_id in sorted(candidates):
+            if belief_id == exclude_id:
+                continue
+            belief = self._beliefs_cache[belief_id]
             if belief.status == "deprecated":
                 continue
             
-            belief_words = set(belief.claim.lower().split())
+            belief_words = self._token_sets[belief_id]
             
             # Jaccard similarity
             intersection = len(claim_words & belief_words)
-            union = len(claim_words | belief_words)
+            union = len(claim_words) + len(belief_words) - intersection
             
             if union > 0:
                 similarity = intersection / union
@@ -298,10 +738,20 @@ Structured claims with provenance and confidence tracking.
         
         return sorted(results, key=lambda x: x[1], reverse=True)
     
-    def check_contradiction(self, new_claim: str, llm_provider=None) -> Dict[str, Any]:
+    def check_contradiction(
+        self,
+        new_claim: str,
+        llm_provider=None,
+        exclude_id: Optional[str] = None,
+        similar: Optional[List[Tuple[Belief, float]]] = None
+    ) -> Dict[str, Any]:
         """
         Check if a new claim contradicts existing beliefs.
         
+        Pass `exclude_id` when the claim is an existing belief's, so it is
+        not compared against itself, and `similar` to reuse an earlier
+        find_similar_beliefs(new_claim, 0.3, exclude_id) result.
+        
         Returns:
             {
                 "has_contradiction": bool,
@@ -315,10 +765,11 @@ Structured claims with provenance and confidence tracking.
             "analysis": ""
         }
         
-        # Find similar beliefs first
-        similar = self.find_similar_beliefs(new_claim, threshold=0.3)
+        # Find similar beliefs first; only a close match is worth an LLM call
+        if similar is None:
+            similar = self.find_similar_beliefs(new_claim, threshold=0.3, exclude_id=exclude_id)
         
-        if not similar:
+        if not similar or similar[0][1] < self.CONTRADICTION_MIN_SIMILARITY:
             return result
         
         # If we have an LLM, ask it to check for contradiction
@@ -326,17 +777,22 @@ Structured claims with provenance and confidence tracking.
             beliefs_text = "\n".join(
                 f"- {b.belief_id}: {b.claim}" for b, _ in similar[:5]
             )
+            # Keyed on the question's content, so an edited claim is asked again
+            cache_key = hashlib.blake2b(
+                f"{new_claim}\n{beliefs_text}".encode(), digest_size=16
+            ).hexdigest()
+            analysis = self._contradiction_cache.get(cache_key)
             
-            from .llm import Message
-            
-            messages = [
-                Message(
-                    role="system",
-                    content="You analyze claims for logical contradictions. Be precise and concise."
-                ),
-                Message(
-                    role="user",
-                    content=f"""Does this new claim contradict any of the existing beliefs?
+            if analysis is not None:
+                self._contradiction_cache.move_to_end(cache_key)
+            else:
+                from .llm import Message, system_message
+                
+                messages = [
+                    system_message(_CONTRADICTION_SYSTEM_PROMPT),
+                    Message(
+                        role="user",
+                        content=f"""Does this new claim contradict any of the existing beliefs?
 
 NEW CLAIM: {new_claim}
 
@@ -346,28 +802,51 @@ EXISTING BELIEFS:
 Reply in this format:
 CONTRADICTS: <belief_id> or NONE
 REASON: <brief explanation>"""
-                )
-            ]
-            
-            try:
-                response = llm_provider.chat(messages)
-                result["analysis"] = response.content
+                    )
+                ]
+                
+                try:
+                    analysis = llm_provider.chat(messages).content
+                except Exception as e:
+                    logger.warning(f"LLM contradiction check failed: {e}")
+                    return result
                 
-                # Parse response
-                if "CONTRADICTS:" in response.content:
-                    match = re.search(r'CONTRADICTS:\s*(B-\d+)', response.content)
-                    if match:
-                        contradicting_id = match.group(1)
-                        belief = self.get_belief(contradicting_id)
-                        if belief:
-                            result["has_contradiction"] = True
-                            result["conflicting_beliefs"] = [belief]
-                            
-            except Exception as e:
-                logger.warning(f"LLM contradiction check failed: {e}")
+                self._contradiction_cache[cache_key] = analysis
+                if len(self._contradiction_cache) > self.CONTRADICTION_CACHE_SIZE:
+                    self._contradiction_cache.popitem(last=False)
+            
+            result["analysis"] = analysis
+            
+            # Parse response
+            if "CONTRADICTS:" in analysis:
+                match = _CONTRADICTS_RE.search(analysis)
+                if match:
+                    contradicting_id = match.group(1)
+                    belief = self.get_belief(contradicting_id)
+                    if belief:
+                        result["has_contradiction"] = True
+                        result["conflicting_beliefs"] = [belief]
         
         return result
     
+    def _load_verdicts(self) -> None:
+        """Merge persisted contradiction verdicts into the in-memory cache."""
+        try:
+            verdicts = json.loads(self.verdicts_file.read_text())
+        except (FileNotFoundError, ValueError):
+            return
+        for key, analysis in verdicts.items():
+            self._contradiction_cache.setdefault(key, analysis)
+        while len(self._contradiction_cache) > self.CONTRADICTION_CACHE_SIZE:
+            self._contradiction_cache.popitem(last=False)
+    
+    def _save_verdicts(self) -> None:
+        """Persist the contradiction verdict cache."""
+        self.verdicts_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.verdicts_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(self._contradiction_cache, indent=2))
+        os.replace(tmp_file, self.verdicts_file)
+    
     # =========================================================================
     # Coherence Check
     # =========================================================================
@@ -397,17 +876,33 @@ REASON: <brief explanation>"""
             b for b in active_beliefs if b.confidence < 0.5
         ]
         
-        # Check each pair for contradictions (expensive!)
+        # Check each pair for contradictions (expensive!); verdicts from
+        # earlier runs are reused while the claims involved are unchanged
         if llm_provider and len(active_beliefs) > 1:
-            # For now, just check a sample
-            for i, belief in enumerate(active_beliefs[:10]):
-                check = self.check_contradiction(belief.claim, llm_provider)
+            self._load_verdicts()
+            # For now, just check a sample, made up only of beliefs whose
+            # closest other belief reaches CONTRADICTION_MIN_SIMILARITY
+            # (below that check_contradiction skips the LLM). No belief is
+            # ever compared against itself.
+            sample = []
+            for belief in active_beliefs:
+                if len(sample) == 10:
+                    break
+                similar = self.find_similar_beliefs(belief.claim, threshold=0.3, exclude_id=belief.belief_id)
+                if similar and similar[0][1] >= self.CONTRADICTION_MIN_SIMILARITY:
+                    sample.append((belief, similar))
+            
+            for belief, similar in sample:
+                check = self.check_contradiction(
+                    belief.claim, llm_provider, exclude_id=belief.belief_id, similar=similar
+                )
                 if check["has_contradiction"]:
                     result["potential_contradictions"].append({
                         "belief": belief.belief_id,
                         "conflicts_with": [b.belief_id for b in check["conflicting_beliefs"]],
                         "analysis": check["analysis"]
                     })
+            self._save_verdicts()
         
         # Write report
         report_dir = self.agent_home / "logs" / "health"
@@ -416,7 +911,7 @@ REASON: <brief explanation>"""
         week = datetime.now().strftime("%Y-W%W")
         report_path = report_dir / f"coherence-{week}.md"
         
-        report_content = f"""# Coherence Check - {week}
+        parts = [f"""# Coherence Check - {week}
 
 Generated: {datetime.now().isoformat()}
 
@@ -430,36 +925,36 @@ Generated: {datetime.now().isoformat()}
 
 ## Low Confidence Beliefs
 
-"""
+"""]
         for b in result["low_confidence"]:
-            report_content += f"- **{b.belief_id}** ({b.confidence:.2f}): {b.claim}\n"
+            parts.append(f"- **{b.belief_id}** ({b.confidence:.2f}): {b.claim}\n")
         
         if not result["low_confidence"]:
-            report_content += "*None*\n"
+            parts.append("*None*\n")
         
-        report_content += """
+        parts.append("""
 ## Potential Contradictions
 
-"""
+""")
         for c in result["potential_contradictions"]:
-            report_content += f"- **{c['belief']}** conflicts with {c['conflicts_with']}\n"
-            report_content += f"  Analysis: {c['analysis'][:200]}...\n\n"
+            parts.append(f"- **{c['belief']}** conflicts with {c['conflicts_with']}\n")
+            parts.append(f"  Analysis: {c['analysis'][:200]}...\n\n")
         
         if not result["potential_contradictions"]:
-            report_content += "*None detected*\n"
+            parts.append("*None detected*\n")
         
-        report_content += """
+        parts.append("""
 ## Recommendations
 
-"""
+""")
         if result["low_confidence"]:
-            report_content += "- Review and validate low-confidence beliefs\n"
+            parts.append("- Review and validate low-confidence beliefs\n")
         if result["potential_contradictions"]:
-            report_content += "- Resolve contradictions by contesting or deprecating beliefs\n"
+            parts.append("- Resolve contradictions by contesting or deprecating beliefs\n")
         if not result["low_confidence"] and not result["potential_contradictions"]:
-            report_content += "- Belief system is coherent ✓\n"
+            parts.append("- Belief system is coherent ✓\n")
         
-        report_path.write_text(report_content)
+        report_path.write_text("".join(parts))
         result["report_path"] = str(report_path)
         
         logger.info(f"Coherence check complete: {len(result['potential_contradictions'])} issues found")
@@ -486,33 +981,10 @@ Generated: {datetime.now().isoformat()}
         if not llm_provider:
             return []
         
-        from .llm import Message
+        from .llm import Message, system_message
         
         messages = [
-            Message(
-                role="system",
-                content="""You extract meaningful BELIEFS from task outcomes.
-
-A BELIEF is something the agent should remember about the world, its capabilities, 
-or its environment that will help with future tasks. 
-
-GOOD beliefs (extract these):
-- "The backup directory /mnt/backups has 50GB free space"
-- "Python 3.11 is installed at /usr/bin/python3"  
-- "The config file uses YAML format, not JSON"
-- "Git commits require --signoff flag in this repository"
-- "The API rate limit is 100 requests per minute"
-
-BAD beliefs (DO NOT extract):
-- "The agent ran command X" (this is a log, not a belief)
-- "The task completed successfully" (this is task status)
-- "The agent planned to do X then Y" (this is procedure, not belief)
-- "The output contained X lines" (this is ephemeral data)
-- "File X was backed up to Y" (this is action taken, not world knowledge)
-
-Only extract beliefs that would help the agent make better decisions in FUTURE tasks.
-If the task outcome doesn't reveal any meaningful world knowledge, say NO_OBSERVATIONS."""
-            ),
+            system_message(_EXTRACTION_SYSTEM_PROMPT),
             Message(
                 role="user",
                 content=f"""Task: {task_description}
@@ -540,37 +1012,38 @@ If nothing meaningful to record, respond with: NO_OBSERVATIONS"""
                 return []
             
             # Parse observations
-            obs_pattern = r'OBSERVATION:\s*(.+?)\nCONFIDENCE:\s*([\d.]+)\nTYPE:\s*(\w+)'
-            matches = re.findall(obs_pattern, response.content, re.MULTILINE)
+            matches = _OBSERVATION_RE.findall(response.content)
             
-            for claim, conf, obs_type in matches:
-                # Filter out operational-sounding claims
-                claim_lower = claim.lower()
-                skip_phrases = [
-                    "the agent", "agent's", "agent planned", "agent ran",
-                    "was backed up", "was created", "was executed",
-                    "the task", "task completed", "command was",
-                    "script reads", "script writes", "embedded python"
-                ]
-                if any(phrase in claim_lower for phrase in skip_phrases):
-                    logger.debug(f"Skipping operational observation: {claim[:50]}...")
-                    continue
-                
-                # Check for contradictions first
-                contradiction_check = self.check_contradiction(claim, llm_provider)
-                
-                if contradiction_check["has_contradiction"]:
-                    logger.warning(f"Skipping contradicting observation: {claim[:50]}...")
-                    continue
-                
-                belief = self.add_belief(
-                    claim=claim.strip(),
-                    confidence=float(conf),
-                    belief_type=obs_type.strip(),
-                    source=f"task:{task_id}",
-                    notes=f"Extracted from task outcome"
-                )
-                extracted.append(belief)
+            # One journal write for everything extracted from this outcome
+            with self.batch():
+                for claim, conf, obs_type in matches:
+                    # Filter out operational-sounding claims
+                    claim_lower = claim.lower()
+                    skip_phrases = [
+                        "the agent", "agent's", "agent planned", "agent ran",
+                        "was backed up", "was created", "was executed",
+                        "the task", "task completed", "command was",
+                        "script reads", "script writes", "embedded python"
+                    ]
+                    if any(phrase in claim_lower for phrase in skip_phrases):
+                        logger.debug(f"Skipping operational observation: {claim[:50]}...")
+                        continue
+                    
+                    # Check for contradictions first
+                    contradiction_check = self.check_contradiction(claim, llm_provider)
+                    
+                    if contradiction_check["has_contradiction"]:
+                        logger.warning(f"Skipping contradicting observation: {claim[:50]}...")
+                        continue
+                    
+                    belief = self.add_belief(
+                        claim=claim.strip(),
+                        confidence=float(conf),
+                        belief_type=obs_type.strip(),
+                        source=f"task:{task_id}",
+                        notes=f"Extracted from task outcome"
+                    )
+                    extracted.append(belief)
             
         except Exception as e:
             logger.error(f"Failed to extract beliefs: {e}")
@@ -589,9 +1062,9 @@ If nothing meaningful to record, respond with: NO_OBSERVATIONS"""
         if not active:
             return "# Beliefs\n\n*No active beliefs recorded.*\n"
         
-        content = "# Active Beliefs\n\n"
+        parts = ["# Active Beliefs\n\n"]
         for belief in active:
             conf_indicator = "🟢" if belief.confidence >= 0.8 else "🟡" if belief.confidence >= 0.5 else "🔴"
-            content += f"- {conf_indicator} **{belief.belief_id}** ({belief.confidence:.1f}): {belief.claim}\n"
+            parts.append(f"- {conf_indicator} **{belief.belief_id}** ({belief.confidence:.1f}): {belief.claim}\n")
         
-        return content
+        return "".join(parts)
@@ -11,11 +11,12 @@ from pathlib import Path
 from typing import Tuple, Dict, Any, Optional
 import json
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentBudgets:
     """
     Hard constraints on agent behavior.
@@ -115,11 +116,13 @@ class BudgetEnforcer:
     can report meaningfully to the user.
     """
     
-    def __init__(self, budgets: AgentBudgets, agent_home: Path):
+    def __init__(self, budgets: AgentBudgets, agent_home: Path, save_every: int = 1):
         self.budgets = budgets
         self.agent_home = agent_home
         self.budget_file = agent_home / "runtime" / "budgets.json"
         self.budget_file.parent.mkdir(parents=True, exist_ok=True)
+        self.save_every = max(1, save_every)
+        self._unsaved_iterations = 0
     
     def check_can_continue(self) -> Tuple[bool, str]:
         """
@@ -191,12 +194,29 @@ class BudgetEnforcer:
         return True, ""
     
     def save_state(self) -> None:
-        """Persist budget state for recovery."""
+        """Persist budget state for recovery (atomically, synced to disk)."""
         state = {
             "timestamp": datetime.now().isoformat(),
             "budgets": self.budgets.to_dict(),
         }
-        self.budget_file.write_text(json.dumps(state, indent=2))
+        tmp_file = self.budget_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
+            f.write(json.dumps(state, indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.budget_file)
+        self._unsaved_iterations = 0
+    
+    def checkpoint(self) -> None:
+        """Note a recorded iteration, persisting every `save_every` iterations or once a limit is hit."""
+        self._unsaved_iterations += 1
+        if self._unsaved_iterations >= self.save_every or not self.check_can_continue()[0]:
+            self.save_state()
+    
+    def flush(self) -> None:
+        """Persist any iterations not yet saved by checkpoint()."""
+        if self._unsaved_iterations:
+            self.save_state()
     
     def load_state(self) -> None:
         """Load persisted budget state."""
@@ -2,12 +2,14 @@
 Configuration loading and validation.
 """
 
+import hashlib
 import os
+import pickle
 import re
+import tempfile
 from pathlib import Path
 from typing import Optional
 
-import yaml
 from pydantic import BaseModel, Field
 
 
@@ -39,11 +41,18 @@ class LLMConfig(BaseModel):
 class ContextConfig(BaseModel):
     max_tokens: int = 8000
     response_reserve: int = 2000
+    compression: str = "drop"  # Over-budget cycle prompts: none | drop (old history) | summarize (LLM)
 
 
 class ExecutionConfig(BaseModel):
     command_timeout: int = 300
+    max_output_bytes: int = 65536  # Per stream; output beyond this is discarded, not buffered
     max_retries: int = 3
+    preflight_cache_seconds: int = 30  # Reuse a passing pre-flight while boot files are unchanged
+    llm_health_cache_seconds: int = 300  # Reuse a successful LLM reachability probe
+    preflight_recheck_seconds: int = 300  # In run(), how long a passing pre-flight is trusted
+    inbox_poll_seconds: float = 1.0  # In run(), how often an idle agent checks the inbox for changes (0 = off)
+    fast_path: bool = False  # Run trivially deterministic tasks (e.g. "create directory X") without the LLM
 
 
 class BudgetConfig(BaseModel):
@@ -54,6 +63,8 @@ class BudgetConfig(BaseModel):
     max_active_tasks: int = 10
     max_pending_tasks: int = 50
     max_task_duration_minutes: int = 30
+    min_cycle_interval_ms: float = 0.0  # Floor on time between cycles (0 = no delay)
+    state_save_interval: int = 5  # Persist budget state every N cycles (and at tick end)
 
 
 class CuriosityConfig(BaseModel):
@@ -65,6 +76,13 @@ class CuriosityConfig(BaseModel):
     max_depth: int = 2  # How deep curiosity chains can go
 
 
+class CacheConfig(BaseModel):
+    """Caching of LLM results."""
+    enabled: bool = False  # Reuse plans when a task's recent history repeats
+    plan_ttl_seconds: int = 3600
+    plan_max_entries: int = 256
+
+
 class LoggingConfig(BaseModel):
     level: str = "INFO"
     console: bool = True
@@ -77,18 +95,20 @@ class Config(BaseModel):
     execution: ExecutionConfig = Field(default_factory=ExecutionConfig)
     budgets: BudgetConfig = Field(default_factory=BudgetConfig)
     curiosity: CuriosityConfig = Field(default_factory=CuriosityConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
 
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+
 def expand_env_vars(value: str) -> str:
     """Expand ${VAR} patterns in strings."""
-    pattern = re.compile(r'\$\{([^}]+)\}')
-    
     def replacer(match):
         var_name = match.group(1)
         return os.environ.get(var_name, "")
     
-    return pattern.sub(replacer, value)
+    return _ENV_VAR_RE.sub(replacer, value)
 
 
 def process_config_values(obj):
@@ -102,11 +122,56 @@ def process_config_values(obj):
     return obj
 
 
-def load_config(path: Path) -> Config:
-    """Load configuration from YAML file."""
+def _config_cache_path(path: Path) -> Path:
+    """Location of the parsed-YAML cache for a config file."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha256(str(Path(path).resolve()).encode()).hexdigest()[:16]
+    return Path(base) / "tooeybot" / f"config-{digest}.pkl"
+
+
+def _load_raw_config(path: Path):
+    """Parse the YAML file, reusing a cached parse while its mtime and size match.
+    
+    Environment variables are expanded after this step, so the cache never
+    holds expanded secrets and picks up environment changes.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cache_path = _config_cache_path(path)
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, raw_config = pickle.load(f)
+        if cached_key == key:
+            return raw_config
+    except Exception:
+        pass
+    
+    import yaml
     with open(path, 'r') as f:
         raw_config = yaml.safe_load(f)
     
+    # Cache is best-effort; any failure just means parsing YAML next time
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=".config-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((key, raw_config), f)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception:
+        pass
+    
+    return raw_config
+
+
+def load_config(path: Path) -> Config:
+    """Load configuration from YAML file."""
+    raw_config = _load_raw_config(path)
+    
     # Expand environment variables
     processed = process_config_values(raw_config)
     
@@ -5,9 +5,10 @@ Manages loading and prioritizing context from the agent's filesystem.
 """
 
 import hashlib
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Dict, TYPE_CHECKING
+from typing import List, Optional, Dict, Tuple, TYPE_CHECKING
 import logging
 
 if TYPE_CHECKING:
@@ -16,6 +17,39 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Path -> (mtime_ns, size, sha256) of each file last hashed by file_sha256()
+_hash_cache: Dict[str, Tuple[int, int, str]] = {}
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    """SHA256 of a file's text, recomputed only when its mtime or size changes.
+    
+    Returns None if the file is missing, unreadable or empty.
+    """
+    key = os.fspath(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    cached = _hash_cache.get(key)
+    if st is not None and cached is not None:
+        mtime_ns, size, digest = cached
+        if (mtime_ns, size) == (st.st_mtime_ns, st.st_size):
+            return digest
+    
+    _hash_cache.pop(key, None)
+    try:
+        content = Path(path).read_text()
+    except Exception as e:
+        logger.warning(f"Could not read {path}: {e}")
+        return None
+    if not content:
+        return None
+    digest = hashlib.sha256(content.encode()).hexdigest()
+    if st is not None:
+        _hash_cache[key] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
 
 @dataclass
 class ContextItem:
@@ -217,11 +251,11 @@ class ContextAssembler:
         return "\n\n---\n\n".join(assembled)
     
     def get_invariants_hash(self) -> Optional[str]:
-        """Get SHA256 hash of invariants file for drift detection."""
-        content = self.read_file_safe(self.boot_dir / "invariants.md")
-        if content:
-            return hashlib.sha256(content.encode()).hexdigest()
-        return None
+        """Get SHA256 hash of invariants file for drift detection.
+        
+        The hash is recomputed only when the file's mtime or size changes.
+        """
+        return file_sha256(self.boot_dir / "invariants.md")
     
     def get_identity_hash(self) -> Optional[str]:
         """Get SHA256 hash of identity file for drift detection."""
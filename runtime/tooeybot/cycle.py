@@ -5,21 +5,57 @@ Implements the PLAN → ACT → OBSERVE → REFLECT → DECIDE loop.
 Each cycle is one complete iteration of agent reasoning.
 """
 
+import copy
+import hashlib
 import json
+import os
 import re
+import shlex
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import Callable, List, Dict, Any, Iterator, Optional, Tuple, TYPE_CHECKING
 import logging
 
+from ._fastjson import dumps_line
+from .context import ContextAssembler
+
 if TYPE_CHECKING:
     from .agent import Agent
     from .tasks import Task
 
 logger = logging.getLogger(__name__)
 
+# Fenced (optionally ```json) block in an LLM response
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*\n?(.*?)\n?```', re.DOTALL)
+
+# Decision keywords in the DECIDE response
+_DECISION_RE = re.compile(r'COMPLETE|BLOCKED|ASK_USER', re.IGNORECASE)
+
+CHARS_PER_TOKEN = ContextAssembler.CHARS_PER_TOKEN
+
+# Task descriptions that map to a single shell command without planning.
+# Patterns are anchored so only the whole description can match.
+_FAST_PATHS: List[Tuple["re.Pattern[str]", Callable[["re.Match[str]"], str]]] = [
+    (re.compile(r'^\s*run(?: the)? command:?\s*`([^`]+)`\s*\.?\s*$', re.IGNORECASE),
+     lambda m: m.group(1).strip()),
+    (re.compile(r'^\s*create (?:a |the )?(?:directory|dir|folder)\s+`?([\w./~-]+)`?\s*\.?\s*$', re.IGNORECASE),
+     lambda m: f"mkdir -p -- {shlex.quote(m.group(1))}"),
+]
+
+
+def match_fast_path(description: str) -> Optional[str]:
+    """Return the shell command for a trivially deterministic task, if any."""
+    for pattern, build in _FAST_PATHS:
+        match = pattern.match(description)
+        if match:
+            return build(match)
+    return None
+
 
 class CyclePhase(Enum):
     """Phases of a reasoning cycle."""
@@ -245,25 +281,78 @@ class CycleResult:
     decision: Decision
     proposed_tasks: List[CuriosityProposal]
     summary: str = ""
+    # Derived from the final state so callers don't repeat the None checks
+    progress: bool = field(init=False)
+    had_failure: bool = field(init=False)
+    
+    def __post_init__(self):
+        reflection = self.state.reflection
+        observation = self.state.observation
+        self.progress = bool(reflection and reflection.progress_made)
+        self.had_failure = bool(observation and not observation.success)
 
 
 class CycleHistory:
-    """Manages cycle history persistence."""
+    """Manages cycle history persistence.
+    
+    Alongside each task's JSONL history, a small `{task_id}.meta.json`
+    sidecar holds the cycle count and the byte offsets of the last few
+    cycles, so status queries read only those records rather than parsing
+    the whole history.
+    """
+    
+    # Number of most recent cycles kept in the summary sidecar
+    SUMMARY_WINDOW = 5
     
     def __init__(self, agent_home: Path):
         self.agent_home = agent_home
         self.history_dir = agent_home / "tasks" / "history"
         self.history_dir.mkdir(parents=True, exist_ok=True)
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        # Append descriptors held open by append_session(), keyed by task_id
+        self._append_fds: Dict[str, int] = {}
     
     def get_history_file(self, task_id: str) -> Path:
         """Get the history file path for a task."""
         return self.history_dir / f"{task_id}.jsonl"
     
+    def get_meta_file(self, task_id: str) -> Path:
+        """Get the summary sidecar path for a task."""
+        return self.history_dir / f"{task_id}.meta.json"
+    
     def append_cycle(self, state: CycleState) -> None:
-        """Append a cycle state to history."""
+        """Append a cycle state to history and update the summary sidecar."""
         history_file = self.get_history_file(state.task_id)
-        with open(history_file, "a") as f:
-            f.write(json.dumps(state.to_dict()) + "\n")
+        summary = self._load_summary(state.task_id)
+        data = dumps_line(state.to_dict())
+        fd = self._append_fds.get(state.task_id)
+        if fd is not None:
+            os.write(fd, data)
+            size = os.lseek(fd, 0, os.SEEK_CUR)
+        else:
+            with open(history_file, "ab", buffering=0) as f:
+                f.write(data)
+                size = f.tell()
+        
+        summary["count"] += 1
+        summary["offsets"] = (summary["offsets"] + [size - len(data)])[-self.SUMMARY_WINDOW:]
+        summary["size"] = size
+        self._write_summary(state.task_id, summary)
+    
+    @contextmanager
+    def append_session(self, task_id: str) -> Iterator[None]:
+        """Keep the task's history file open for appends within the block."""
+        fd = os.open(
+            self.get_history_file(task_id),
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644,
+        )
+        self._append_fds[task_id] = fd
+        try:
+            yield
+        finally:
+            del self._append_fds[task_id]
+            os.close(fd)
     
     def load_history(self, task_id: str) -> List[CycleState]:
         """Load all cycles for a task."""
@@ -280,14 +369,151 @@ class CycleHistory:
                     logger.warning(f"Could not parse cycle: {e}")
         return cycles
     
+    def load_summary(self, task_id: str) -> Tuple[int, List[CycleState]]:
+        """Get (cycle count, last SUMMARY_WINDOW cycles) for a task."""
+        summary = self._load_summary(task_id)
+        if not summary["offsets"]:
+            return summary["count"], []
+        
+        with open(self.get_history_file(task_id), "rb") as f:
+            f.seek(summary["offsets"][0])
+            data = f.read(summary["size"] - summary["offsets"][0])
+        recent = []
+        for line in data.splitlines():
+            if line.strip():
+                try:
+                    recent.append(CycleState.from_dict(json.loads(line)))
+                except Exception as e:
+                    logger.warning(f"Could not parse cycle: {e}")
+        return summary["count"], recent
+    
+    def _load_summary(self, task_id: str) -> Dict[str, Any]:
+        """Return the task's summary, rebuilding it if it doesn't match the history file."""
+        try:
+            size = os.stat(self.get_history_file(task_id)).st_size
+        except FileNotFoundError:
+            size = 0
+        
+        summary = self._summaries.get(task_id)
+        if summary is None or summary["size"] != size:
+            try:
+                data = json.loads(self.get_meta_file(task_id).read_text())
+                summary = {
+                    "count": data["count"],
+                    "offsets": [int(offset) for offset in data["offsets"]],
+                    "size": data["size"],
+                }
+            except (OSError, ValueError, KeyError, TypeError):
+                summary = None
+        if summary is None or summary["size"] != size:
+            # Missing or stale sidecar: rebuild from the full history once
+            summary = {"count": 0, "offsets": [], "size": size}
+            if size:
+                self._index_history(task_id, summary)
+                self._write_summary(task_id, summary)
+        
+        self._summaries[task_id] = summary
+        return summary
+    
+    def _index_history(self, task_id: str, summary: Dict[str, Any]) -> None:
+        """Count the parseable cycles in the history and note where the last ones start."""
+        with open(self.get_history_file(task_id), "rb") as f:
+            data = f.read(summary["size"])
+        offsets = []
+        start = 0
+        for line in data.splitlines(keepends=True):
+            if line.strip():
+                try:
+                    CycleState.from_dict(json.loads(line))
+                except Exception:
+                    pass
+                else:
+                    summary["count"] += 1
+                    offsets.append(start)
+            start += len(line)
+        summary["offsets"] = offsets[-self.SUMMARY_WINDOW:]
+    
+    def _write_summary(self, task_id: str, summary: Dict[str, Any]) -> None:
+        """Atomically replace the summary sidecar."""
+        meta_file = self.get_meta_file(task_id)
+        tmp_file = meta_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(summary))
+        os.replace(tmp_file, meta_file)
+        self._summaries[task_id] = summary
+    
     def get_last_cycle(self, task_id: str) -> Optional[CycleState]:
         """Get the most recent cycle for a task."""
-        history = self.load_history(task_id)
-        return history[-1] if history else None
+        _, recent = self.load_summary(task_id)
+        return recent[-1] if recent else None
     
     def get_cycle_count(self, task_id: str) -> int:
         """Get the number of cycles for a task."""
-        return len(self.load_history(task_id))
+        return self._load_summary(task_id)["count"]
+
+
+def _text_digest(text: Optional[str]) -> str:
+    """Short digest of command output, ignoring whitespace differences."""
+    if not text:
+        return ""
+    normalized = " ".join(text[:2000].split())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+class PlanCache:
+    """Bounded in-memory LRU of plans, with entries expiring after a TTL."""
+    
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, Plan]]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(task: "Task", history: List[CycleState], window: int = 5) -> bytes:
+        """Fingerprint a task and the actions/observations of its recent cycles.
+        
+        Only fields that describe the state are used: the action's type and
+        payload, and the observation's outcome with digests of its output
+        and error (first 2000 chars, whitespace-normalized). Timing and the
+        LLM's free-text reasoning are left out so repeats still match.
+        """
+        tail = []
+        for c in history[-window:]:
+            action = c.action
+            obs = c.observation
+            tail.append({
+                "action": [action.action_type.value, action.payload] if action else None,
+                "observation": [
+                    obs.success,
+                    obs.files_modified,
+                    _text_digest(obs.output),
+                    _text_digest(obs.error),
+                ] if obs else None,
+            })
+        material = json.dumps(
+            [task.task_id, task.description, task.context, tail],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode()).digest()
+    
+    def get(self, key: bytes) -> Optional[Plan]:
+        """Return a copy of the cached plan, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, plan = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(plan)
+    
+    def put(self, key: bytes, plan: Plan) -> None:
+        """Store a plan, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic(), copy.deepcopy(plan))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
 
 
 class ReasoningCycle:
@@ -430,17 +656,54 @@ Respond with ONLY one word: CONTINUE, COMPLETE, BLOCKED, or ASK_USER"""
     ):
         self.agent = agent
         self.task = task
-        self.cycle_id = cycle_id
         self.history = history
+        self._start_cycle(cycle_id)
+        
+        # Prompt fragments that only depend on the task, reused by every cycle
+        criteria = (
+            "\n".join(f"- {c}" for c in task.success_criteria)
+            if task.success_criteria else "- Complete the task successfully"
+        )
+        self._task_spec = f"""Task ID: {task.task_id}
+Priority: {task.priority}
+Description: {task.description}
+
+Success Criteria:
+{criteria}
+"""
+        self._task_context = (
+            f"\n## Additional Context / User Replies\n{task.context}"
+            if task.context else ""
+        )
+        # LLM summaries of over-budget history, keyed by the history's hash
+        self._history_summaries: Dict[str, str] = {}
+        # Shell command for a deterministic task; used on its first cycle only
+        self._fast_path_command = (
+            match_fast_path(task.description)
+            if agent.config.execution.fast_path else None
+        )
+    
+    def _start_cycle(self, cycle_id: int) -> None:
+        """Reset per-cycle state for a new cycle."""
+        self.cycle_id = cycle_id
         self.state = CycleState(
             cycle_id=cycle_id,
-            task_id=task.task_id,
+            task_id=self.task.task_id,
             phase=CyclePhase.PLAN,
         )
     
+    def run_next(self, cycle_id: int) -> CycleResult:
+        """Run another cycle of the same task, reusing the task-level setup."""
+        self._start_cycle(cycle_id)
+        return self.run()
+    
     def run(self) -> CycleResult:
         """Execute one complete cycle."""
         try:
+            # Deterministic tasks skip the LLM entirely on a fresh start
+            if self._fast_path_command is not None and not self.history:
+                return self._run_fast_path(self._fast_path_command)
+            
             # PLAN phase
             self.state.phase = CyclePhase.PLAN
             plan = self._plan()
@@ -515,34 +778,85 @@ Respond with ONLY one word: CONTINUE, COMPLETE, BLOCKED, or ASK_USER"""
                 summary=f"Cycle failed: {e}",
             )
     
+    def _run_fast_path(self, command: str) -> CycleResult:
+        """
+        Run a deterministic task's command without calling the LLM.
+        
+        Success completes the task; on failure the cycle continues and the
+        next one plans normally with this attempt in its history.
+        """
+        logger.info(f"Fast path for {self.task.task_id}: {command}")
+        action = Action(
+            action_type=ActionType.EXECUTE_COMMAND,
+            payload={"command": command},
+            reasoning="Task matches a deterministic fast-path pattern",
+        )
+        self.state.plan = Plan(
+            goal=self.task.description,
+            approach="fast path",
+            next_action=action,
+            confidence=1.0,
+        )
+        self.state.action = action
+        
+        self.state.phase = CyclePhase.ACT
+        observation = self._act(action)
+        self.state.observation = observation
+        
+        self.state.phase = CyclePhase.REFLECT
+        if observation.success:
+            what_learned = f"Fast path command succeeded: {command}"
+        else:
+            what_learned = f"Fast path command failed: {observation.error or 'non-zero exit'}"
+        self.state.reflection = Reflection(
+            progress_made=observation.success,
+            what_learned=what_learned,
+            plan_still_valid=observation.success,
+            confidence=1.0 if observation.success else 0.5,
+        )
+        
+        self.state.phase = CyclePhase.DECIDE
+        decision = Decision.COMPLETE if observation.success else Decision.CONTINUE
+        self.state.decision = decision
+        
+        self.agent.event_logger.log_event(
+            "fast_path",
+            {"command": command, "success": observation.success, "fast_path": True},
+            task_id=self.task.task_id,
+        )
+        
+        return CycleResult(
+            state=self.state,
+            decision=decision,
+            proposed_tasks=[],
+            summary=what_learned,
+        )
+    
     def _plan(self) -> Plan:
         """Generate a plan with exactly one action."""
         from .llm import Message
         
-        # Build task spec
-        task_spec = f"""Task ID: {self.task.task_id}
-Priority: {self.task.priority}
-Description: {self.task.description}
-
-Success Criteria:
-{chr(10).join(f'- {c}' for c in self.task.success_criteria) if self.task.success_criteria else '- Complete the task successfully'}
-"""
+        # Reuse a cached plan when this task has been at the same point before
+        plan_cache = self.agent.plan_cache
+        cache_key = None
+        if plan_cache is not None:
+            cache_key = PlanCache.make_key(self.task, self.history)
+            cached = plan_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Reusing cached plan for cycle {self.cycle_id}")
+                return cached
         
-        # Build task context (includes user replies, additional info)
-        task_context = ""
-        if self.task.context:
-            task_context = f"\n## Additional Context / User Replies\n{self.task.context}"
-        
-        # Build history summary
-        history_summary = self._build_history_summary()
+        # Task spec and context (user replies, additional info) are built once
+        # per task in __init__
         
-        prompt = self.PLAN_PROMPT.format(
-            task_spec=task_spec,
-            task_context=task_context,
-            history_summary=history_summary,
+        prompt_args = dict(
+            task_spec=self._task_spec,
+            task_context=self._task_context,
             cycle_num=self.cycle_id,
             max_cycles=self.agent.budgets.max_iterations_per_task,
         )
+        history_summary = self._history_within_budget(self.PLAN_PROMPT, prompt_args)
+        prompt = self.PLAN_PROMPT.format(history_summary=history_summary, **prompt_args)
         
         messages = [Message(role="user", content=prompt)]
         response = self.agent.llm.chat(messages)
@@ -557,13 +871,16 @@ Success Criteria:
             reasoning=action_data.get("reasoning", ""),
         )
         
-        return Plan(
+        plan = Plan(
             goal=plan_data.get("goal", "Complete the task"),
             approach=plan_data.get("approach", ""),
             next_action=action,
             remaining_steps=plan_data.get("remaining_steps", []),
             confidence=plan_data.get("confidence", 0.7),
         )
+        if cache_key is not None:
+            plan_cache.put(cache_key, plan)
+        return plan
     
     def _act(self, action: Action) -> Observation:
         """Execute the planned action."""
@@ -641,14 +958,12 @@ Success Criteria:
         """Generate structured reflection."""
         from .llm import Message
         
-        history_summary = self._build_history_summary()
-        
         # Build task context (includes user replies)
         task_context = ""
         if self.task.context:
             task_context = f"\n## User Replies / Context\n{self.task.context}"
         
-        prompt = self.REFLECT_PROMPT.format(
+        prompt_args = dict(
             task_description=self.task.description,
             task_context=task_context,
             action_type=action.action_type.value,
@@ -657,8 +972,9 @@ Success Criteria:
             success=observation.success,
             output=observation.output[:1000] if observation.output else "(no output)",
             error=observation.error or "(no error)",
-            history_summary=history_summary,
         )
+        history_summary = self._history_within_budget(self.REFLECT_PROMPT, prompt_args)
+        prompt = self.REFLECT_PROMPT.format(history_summary=history_summary, **prompt_args)
         
         messages = [Message(role="user", content=prompt)]
         response = self.agent.llm.chat(messages)
@@ -704,24 +1020,80 @@ Success Criteria:
         messages = [Message(role="user", content=prompt)]
         response = self.agent.llm.chat(messages)
         
-        decision_text = response.content.strip().upper()
+        # One scan for all keywords; COMPLETE beats BLOCKED beats ASK_USER
+        # wherever they appear, defaulting to CONTINUE
+        found = set()
+        for match in _DECISION_RE.finditer(response.content):
+            keyword = match.group().upper()
+            if keyword == "COMPLETE":
+                return Decision.COMPLETE
+            found.add(keyword)
         
-        if "COMPLETE" in decision_text:
-            return Decision.COMPLETE
-        elif "BLOCKED" in decision_text:
+        if "BLOCKED" in found:
             return Decision.BLOCKED
-        elif "ASK_USER" in decision_text:
+        elif "ASK_USER" in found:
             return Decision.ASK_USER
         else:
             return Decision.CONTINUE
     
-    def _build_history_summary(self) -> str:
+    def _history_within_budget(self, template: str, prompt_args: Dict[str, Any]) -> str:
+        """
+        History summary for a prompt, compressed to keep the prompt within
+        90% of the context token budget.
+        
+        With `context.compression` set to "drop" (the default), older cycles
+        are dropped first; "summarize" additionally falls back to an LLM
+        summary of what remains; "none" always sends the full history.
+        """
+        history = self._build_history_summary()
+        context_config = self.agent.config.context
+        if context_config.compression == "none" or not self.history:
+            return history
+        
+        budget = int((context_config.max_tokens - context_config.response_reserve) * 0.9)
+        fixed_tokens = len(template.format(history_summary="", **prompt_args)) // CHARS_PER_TOKEN
+        available = budget - fixed_tokens
+        if len(history) // CHARS_PER_TOKEN <= available:
+            return history
+        
+        for limit in (3, 1):
+            history = self._build_history_summary(limit)
+            if len(history) // CHARS_PER_TOKEN <= available:
+                logger.info(f"Prompt over token budget, kept last {limit} cycle(s) of history")
+                return history
+        
+        if context_config.compression == "summarize":
+            return self._summarize_history(history, max(available, 50))
+        logger.warning("Prompt over token budget even with one cycle of history")
+        return history
+    
+    def _summarize_history(self, history: str, max_tokens: int) -> str:
+        """Condense a history summary with the LLM, caching per distinct history."""
+        from .llm import Message
+        
+        key = hashlib.sha256(history.encode()).hexdigest()
+        cached = self._history_summaries.get(key)
+        if cached is not None:
+            return cached
+        
+        prompt = (
+            f"Summarize these previous cycles of work on a task in at most "
+            f"{max_tokens * CHARS_PER_TOKEN // 6} words. Keep the commands, results "
+            f"and errors that matter for choosing the next step.\n\n{history}"
+        )
+        response = self.agent.llm.chat([Message(role="user", content=prompt)])
+        summary = response.content.strip()[:max_tokens * CHARS_PER_TOKEN]
+        logger.info("Prompt over token budget, using LLM summary of history")
+        self._history_summaries[key] = summary
+        return summary
+    
+    def _build_history_summary(self, limit: int = 5) -> str:
         """Build a rich summary of previous cycles including outputs and learnings."""
         if not self.history:
             return "No previous cycles. This is a fresh start."
         
         summary_lines = []
-        for cycle in self.history[-5:]:  # Last 5 cycles
+        for cycle in self.history[-limit:]:  # Last `limit` cycles
             action_type = cycle.action.action_type.value if cycle.action else "unknown"
             
             # Start with cycle header
@@ -771,7 +1143,7 @@ Success Criteria:
     def _parse_json_response(self, content: str) -> Dict[str, Any]:
         """Parse JSON from LLM response, handling markdown code blocks."""
         # Try to extract JSON from code block
-        json_match = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', content, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(content)
         if json_match:
             content = json_match.group(1)
         
@@ -2,7 +2,10 @@
 Shell command executor with safety controls.
 """
 
+import os
+import signal
 import subprocess
+import threading
 import time
 import shlex
 from dataclasses import dataclass
@@ -14,18 +17,84 @@ from .logger import EventLogger
 
 logger = logging.getLogger(__name__)
 
+# Read size when draining a command's output pipes
+_CHUNK_SIZE = 65536
+
+# How long output readers get to reach EOF after a timed-out command is killed
+_KILL_GRACE_SECONDS = 5.0
+
 
 @dataclass
 class ExecutionResult:
-    """Result of a command execution."""
+    """Result of a command execution.
+    
+    Output is kept as captured bytes and decoded only when read, with
+    newlines translated as text-mode pipes do ("\r\n" and "\r" become "\n").
+    """
     command: str
     args: List[str]
     cwd: str
     exit_code: int
-    stdout: str
-    stderr: str
+    stdout_raw: bytes
+    stderr_raw: bytes
     duration_ms: int
     timed_out: bool = False
+    
+    @property
+    def stdout(self) -> str:
+        return _decode(self.stdout_raw)
+    
+    @property
+    def stderr(self) -> str:
+        return _decode(self.stderr_raw)
+
+
+def _decode(data: bytes) -> str:
+    """Decode captured output with universal newlines."""
+    return data.decode(errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _CappedBuffer:
+    """Keeps the first `limit` bytes fed to it and counts the rest."""
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.chunks: List[bytes] = []
+        self.kept = 0
+        self.dropped = 0
+    
+    def feed(self, chunk: bytes) -> None:
+        room = self.limit - self.kept
+        if room > 0:
+            part = chunk[:room]
+            self.chunks.append(part)
+            self.kept += len(part)
+            self.dropped += len(chunk) - len(part)
+        else:
+            self.dropped += len(chunk)
+    
+    def getvalue(self) -> bytes:
+        data = b"".join(self.chunks)
+        if self.dropped:
+            data += f"\n...[{self.dropped} more bytes not captured]".encode()
+        return data
+
+
+def _drain(stream, buffer: _CappedBuffer) -> None:
+    """Read a pipe to EOF into a capped buffer (runs in a reader thread)."""
+    try:
+        for chunk in iter(lambda: stream.read1(_CHUNK_SIZE), b""):
+            buffer.feed(chunk)
+    finally:
+        stream.close()
+
+
+def _kill_group(proc) -> None:
+    """Kill a command and everything it started (it leads its own session)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
 
 
 class Executor:
@@ -35,11 +104,14 @@ class Executor:
         self,
         agent_home: Path,
         event_logger: EventLogger,
-        timeout: int = 300
+        timeout: int = 300,
+        max_output_bytes: int = 65536
     ):
         self.agent_home = agent_home
         self.event_logger = event_logger
         self.timeout = timeout
+        # Per stream; anything beyond this is read and discarded
+        self.max_output_bytes = max_output_bytes
         self.scratch_dir = agent_home / "scratch"
         self.scratch_dir.mkdir(parents=True, exist_ok=True)
     
@@ -55,7 +127,8 @@ class Executor:
         """
         Execute a shell command.
         
-        All executions are logged to the event log.
+        All executions are logged to the event log. At most
+        `max_output_bytes` of stdout and of stderr are kept.
         """
         args = args or []
         cwd = cwd or self.scratch_dir
@@ -68,38 +141,83 @@ class Executor:
         
         start_time = time.monotonic()
         timed_out = False
+        out = _CappedBuffer(self.max_output_bytes)
+        err = _CappedBuffer(self.max_output_bytes)
         
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 full_command,
                 cwd=str(cwd),
-                capture_output=True,
-                text=True,
-                timeout=timeout
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True
             )
-            exit_code = result.returncode
-            stdout = result.stdout
-            stderr = result.stderr
+            readers = [
+                threading.Thread(target=_drain, args=(proc.stdout, out), daemon=True),
+                threading.Thread(target=_drain, args=(proc.stderr, err), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+            
+            # Both the process and its output pipes must finish within the
+            # timeout (a backgrounded child can hold the pipes open)
+            deadline = start_time + timeout
+            try:
+                proc.wait(timeout=timeout)
+                for reader in readers:
+                    reader.join(max(0.0, deadline - time.monotonic()))
+                    if reader.is_alive():
+                        raise subprocess.TimeoutExpired(full_command, timeout)
+            except subprocess.TimeoutExpired:
+                # Killing the whole group also ends backgrounded children
+                # holding the pipes, so the readers reach EOF and close them
+                _kill_group(proc)
+                proc.wait()
+                for reader in readers:
+                    reader.join(_KILL_GRACE_SECONDS)
+                raise
+            exit_code = proc.returncode
+            stdout = out.getvalue()
+            stderr = err.getvalue()
             
-        except subprocess.TimeoutExpired as e:
+        except subprocess.TimeoutExpired:
             timed_out = True
             exit_code = -1
-            stdout = e.stdout or "" if hasattr(e, 'stdout') else ""
-            stderr = f"Command timed out after {timeout}s"
+            stdout = out.getvalue()
+            stderr = f"Command timed out after {timeout}s".encode()
             logger.warning(f"Command timed out: {' '.join(full_command)}")
             
         except FileNotFoundError:
             exit_code = 127
-            stdout = ""
-            stderr = f"Command not found: {command}"
+            stdout = b""
+            stderr = f"Command not found: {command}".encode()
             logger.error(f"Command not found: {command}")
             
         except Exception as e:
             exit_code = -1
-            stdout = ""
-            stderr = str(e)
+            stdout = b""
+            stderr = str(e).encode()
             logger.error(f"Execution error: {e}")
         
+        return self._finish(
+            command, args, cwd, start_time, exit_code, stdout, stderr,
+            timed_out, task_id, skill
+        )
+    
+    def _finish(
+        self,
+        command: str,
+        args: List[str],
+        cwd: Path,
+        start_time: float,
+        exit_code: int,
+        stdout: bytes,
+        stderr: bytes,
+        timed_out: bool,
+        task_id: Optional[str],
+        skill: Optional[str]
+    ) -> ExecutionResult:
+        """Log a finished execution and build its result."""
         end_time = time.monotonic()
         duration_ms = int((end_time - start_time) * 1000)
         
@@ -119,8 +237,8 @@ class Executor:
             args=args,
             cwd=str(cwd),
             exit_code=exit_code,
-            stdout=stdout,
-            stderr=stderr,
+            stdout_raw=stdout,
+            stderr_raw=stderr,
             duration_ms=duration_ms,
             timed_out=timed_out
         )
@@ -4,22 +4,27 @@ LLM Provider abstraction layer.
 Supports multiple providers with a unified interface.
 """
 
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
-import httpx
-
 from .config import LLMConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class Message:
     """A single message in a conversation."""
     role: str  # "system", "user", "assistant"
     content: str
 
 
+@functools.lru_cache(maxsize=32)
+def system_message(content: str) -> Message:
+    """System message for a fixed prompt, shared across calls."""
+    return Message(role="system", content=content)
+
+
 @dataclass
 class LLMResponse:
     """Response from an LLM call."""
@@ -63,6 +68,7 @@ class OllamaProvider(LLMProvider):
             }
         }
         
+        import httpx
         with httpx.Client(timeout=self.timeout) as client:
             response = client.post(url, json=payload)
             response.raise_for_status()
@@ -81,6 +87,7 @@ class OllamaProvider(LLMProvider):
     
     def health_check(self) -> bool:
         try:
+            import httpx
             with httpx.Client(timeout=5) as client:
                 response = client.get(f"{self.base_url}/api/tags")
                 return response.status_code == 200
@@ -119,6 +126,7 @@ class OpenAIProvider(LLMProvider):
         
         logger.debug(f"OpenAI request - model: {self.model}, api_key present: {bool(self.api_key)}, api_key prefix: {self.api_key[:10] if self.api_key else 'NONE'}...")
         
+        import httpx
         with httpx.Client(timeout=self.timeout) as client:
             response = client.post(url, json=payload, headers=headers)
             if response.status_code != 200:
@@ -135,6 +143,7 @@ class OpenAIProvider(LLMProvider):
     
     def health_check(self) -> bool:
         try:
+            import httpx
             with httpx.Client(timeout=5) as client:
                 headers = {"Authorization": f"Bearer {self.api_key}"}
                 response = client.get(f"{self.base_url}/models", headers=headers)
@@ -180,6 +189,7 @@ class AnthropicProvider(LLMProvider):
         if system_msg:
             payload["system"] = system_msg
         
+        import httpx
         with httpx.Client(timeout=self.timeout) as client:
             response = client.post(url, json=payload, headers=headers)
             response.raise_for_status()
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional, List
 from dataclasses import dataclass, asdict
 
+from ._fastjson import dumps_line
 from .config import LoggingConfig
 
 
@@ -101,24 +102,51 @@ class EventLogger:
         self.agent_home = agent_home
         self.events_dir = agent_home / "logs" / "events"
         self.events_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Append handle kept open between events; reopened when the day changes
+        self._log_file = None
+        self._log_date: Optional[str] = None
     
     def _get_today_log(self) -> Path:
         """Get path to today's event log."""
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         return self.events_dir / f"{today}.jsonl"
     
+    def _open_today_log(self):
+        """Return the append handle for today's log, opening it if needed."""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        if self._log_file is None or today != self._log_date:
+            self.close()
+            self._log_file = open(self.events_dir / f"{today}.jsonl", 'ab')
+            self._log_date = today
+        return self._log_file
+    
+    def close(self) -> None:
+        """Close the open log handle; the next event reopens it."""
+        if self._log_file is not None:
+            try:
+                self._log_file.close()
+            except Exception:
+                pass
+            self._log_file = None
+    
     def log(self, event: Event) -> None:
         """Write an event to the log."""
-        log_path = self._get_today_log()
-        
+        self.log_batch([event])
+    
+    def log_batch(self, events: List[Event]) -> None:
+        """Write several events to the log with a single write."""
         try:
-            with open(log_path, 'a') as f:
-                json.dump(event.to_dict(), f, default=str)
-                f.write('\n')
+            data = b"".join(dumps_line(event.to_dict(), default=str) for event in events)
+            f = self._open_today_log()
+            f.write(data)
+            f.flush()
         except Exception as e:
+            self.close()
             # Logging must never fail silently - at least print to stderr
             print(f"CRITICAL: Failed to write event log: {e}", file=sys.stderr)
-            print(f"Event: {event.to_dict()}", file=sys.stderr)
+            for event in events:
+                print(f"Event: {event.to_dict()}", file=sys.stderr)
     
     def log_command(
         self,
@@ -145,6 +173,15 @@ class EventLogger:
         )
         self.log(event)
     
+    @staticmethod
+    def task_update_event(task_id: str, status: str, message: str) -> Event:
+        """Build a task status update event (see log_task_update)."""
+        return Event(
+            event_type="task_update",
+            context=EventContext(task_id=task_id),
+            outcomes=EventOutcomes(observations=f"{status}: {message}")
+        )
+    
     def log_task_update(
         self,
         task_id: str,
@@ -152,12 +189,7 @@ class EventLogger:
         message: str
     ) -> None:
         """Log a task status update."""
-        event = Event(
-            event_type="task_update",
-            context=EventContext(task_id=task_id),
-            outcomes=EventOutcomes(observations=f"{status}: {message}")
-        )
-        self.log(event)
+        self.log(self.task_update_event(task_id, status, message))
     
     def log_error(
         self,
@@ -189,6 +221,19 @@ class EventLogger:
         )
         self.log(event)
     
+    @staticmethod
+    def generic_event(
+        event_type: str,
+        data: dict,
+        task_id: Optional[str] = None
+    ) -> Event:
+        """Build a generic event (see log_event)."""
+        return Event(
+            event_type=event_type,
+            context=EventContext(task_id=task_id),
+            outcomes=EventOutcomes(observations=json.dumps(data))
+        )
+    
     def log_event(
         self,
         event_type: str,
@@ -197,12 +242,7 @@ class EventLogger:
         task_id: Optional[str] = None
     ) -> None:
         """Generic event logging for any event type."""
-        event = Event(
-            event_type=event_type,
-            context=EventContext(task_id=task_id),
-            outcomes=EventOutcomes(observations=json.dumps(data))
-        )
-        self.log(event)
+        self.log(self.generic_event(event_type, data, task_id=task_id))
 
 
 def setup_logging(config: LoggingConfig) -> None:
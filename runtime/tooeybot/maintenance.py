@@ -163,6 +163,9 @@ class MaintenanceManager:
                 )
                 logger.info("Initialized git repository")
             
+            # Restores check out beliefs.md, so it must hold every belief
+            self._fold_belief_journal()
+            
             # Add all files
             subprocess.run(
                 ["git", "add", "-A"],
@@ -233,6 +236,13 @@ class MaintenanceManager:
         
         return result
     
+    def _fold_belief_journal(self) -> None:
+        """Compact any journaled belief updates into beliefs.md."""
+        journal = self.memory_dir / "beliefs.journal.md"
+        if journal.exists() and journal.stat().st_size:
+            from .beliefs import BeliefManager
+            BeliefManager(self.agent_home).compact()
+    
     def list_snapshots(self, limit: int = 10) -> List[Dict[str, Any]]:
         """List recent snapshots."""
         try:
@@ -357,6 +367,16 @@ class MaintenanceManager:
                 check=True
             )
             
+            # A belief journal the snapshot didn't contain would be replayed
+            # over the restored beliefs.md on the next load
+            tracked = subprocess.run(
+                ["git", "cat-file", "-e", f"{commit_or_tag}:memory/beliefs.journal.md"],
+                cwd=self.agent_home,
+                capture_output=True
+            )
+            if tracked.returncode != 0:
+                (self.memory_dir / "beliefs.journal.md").unlink(missing_ok=True)
+            
             result["success"] = True
             logger.info(f"Restored to {commit_or_tag}")
             
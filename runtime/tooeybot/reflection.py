@@ -15,6 +15,10 @@ from .cycle import CycleState, Reflection, CuriosityProposal, Decision
 
 logger = logging.getLogger(__name__)
 
+# Used to normalize error messages before comparing them
+_DIGITS_RE = re.compile(r'\d+')
+_PATH_RE = re.compile(r'/[^\s]+')
+
 
 class StuckDetector:
     """
@@ -86,8 +90,8 @@ class StuckDetector:
         
         # Normalize errors (remove numbers, paths)
         def normalize(e: str) -> str:
-            e = re.sub(r'\d+', 'N', e)
-            e = re.sub(r'/[^\s]+', '/PATH', e)
+            e = _DIGITS_RE.sub('N', e)
+            e = _PATH_RE.sub('/PATH', e)
             return e.lower()[:100]
         
         normalized = [normalize(e) for e in errors if e]
@@ -5,8 +5,10 @@ Skills are documented procedures (Markdown) that the LLM reads and follows.
 This module handles loading, tracking, drafting, and promoting skills.
 """
 
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -15,6 +17,29 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared via llm.system_message so each call reuses the same Message
+_SKILL_DRAFT_SYSTEM_PROMPT = """You identify reusable procedures from task outcomes.
+
+A task outcome should become a SKILL when:
+1. It involved a multi-step procedure (not just one command)
+2. The procedure is likely to be needed again for similar tasks
+3. The procedure has clear inputs and outputs
+4. It's not already a common/trivial operation
+
+Examples of good skills to draft:
+- "Deploy Python App" - multi-step: test, build, deploy, verify
+- "Analyze Log Files" - pattern matching, summarization
+- "Set Up Development Environment" - install dependencies, configure tools
+- "Database Backup and Verify" - dump, compress, checksum, store
+
+Examples of things that are NOT skills:
+- Running a single command like "ls" or "cat"
+- One-time fixes or cleanups
+- Tasks that are too specific to reuse
+- Things the shell already does naturally
+
+If the task doesn't represent a reusable procedure, respond: NO_SKILL"""
+
 
 @dataclass
 class Skill:
@@ -63,9 +88,20 @@ class Skill:
 """
 
 
+@dataclass
+class SkillIndexEntry:
+    """Name and status of a skill file, read from its header only."""
+    name: str
+    status: str
+    path: Path
+
+
 class SkillManager:
     """Manages the skills system."""
     
+    # Task descriptions whose relevant skills are remembered
+    RELEVANCE_CACHE_SIZE = 256
+    
     def __init__(self, agent_home: Path):
         self.agent_home = agent_home
         self.skills_dir = agent_home / "skills"
@@ -78,8 +114,14 @@ class SkillManager:
         # Load tracking data
         self.tracking = self._load_tracking()
         
-        # Cache of loaded skills
+        # Cache of loaded skills, valid while the skill files are unchanged
         self._skills_cache: Dict[str, Skill] = {}
+        self._skills_fingerprint: Optional[tuple] = None
+        
+        # find_relevant_skills results (skill keys) by description digest,
+        # plus each skill's search words; both reset when skills reload
+        self._relevance_cache: "OrderedDict[tuple, List[str]]" = OrderedDict()
+        self._search_terms: Dict[str, tuple] = {}
     
     def _load_tracking(self) -> Dict[str, Any]:
         """Load skill usage tracking data."""
@@ -156,20 +198,70 @@ class SkillManager:
             logger.error(f"Failed to parse skill {path}: {e}")
             return None
     
-    def load_all_skills(self) -> Dict[str, Skill]:
-        """Load all skills from all directories."""
-        skills = {}
-        
+    def _skill_files(self) -> List[tuple]:
+        """List (status_dir, path, mtime_ns, size) for every loadable skill file."""
+        files = []
         for status_dir in ["core", "candidates", "learned"]:
             dir_path = self.skills_dir / status_dir
             if dir_path.exists():
                 for skill_file in dir_path.glob("*.md"):
-                    skill = self._parse_skill(skill_file)
-                    if skill:
-                        key = f"{status_dir}/{skill.name}"
-                        skills[key] = skill
+                    st = skill_file.stat()
+                    files.append((status_dir, skill_file, st.st_mtime_ns, st.st_size))
+        return files
+    
+    def load_all_skills(self) -> Dict[str, Skill]:
+        """Load all skills from all directories, reusing the cache if no file changed."""
+        files = self._skill_files()
+        fingerprint = tuple((d, p.name, mtime, size) for d, p, mtime, size in files)
+        if self._skills_cache and fingerprint == self._skills_fingerprint:
+            return self._skills_cache
+        
+        skills = {}
+        
+        for status_dir, skill_file, _, _ in files:
+            skill = self._parse_skill(skill_file)
+            if skill:
+                key = f"{status_dir}/{skill.name}"
+                skills[key] = skill
         
         self._skills_cache = skills
+        self._skills_fingerprint = fingerprint
+        self._relevance_cache.clear()
+        self._search_terms = {}
+        return skills
+    
+    def load_skills_index(self) -> List[SkillIndexEntry]:
+        """Scan skill files for their name and status without parsing sections."""
+        entries = []
+        for _, skill_file, _, _ in self._skill_files():
+            name, status = skill_file.stem, "unknown"
+            try:
+                with open(skill_file) as f:
+                    for line in f:
+                        if line.startswith("## "):
+                            break
+                        if line.startswith("# Skill:"):
+                            name = line[len("# Skill:"):].strip() or name
+                        elif line.startswith("Status:"):
+                            status = line[len("Status:"):].strip() or status
+            except OSError as e:
+                logger.error(f"Failed to index skill {skill_file}: {e}")
+                continue
+            entries.append(SkillIndexEntry(name=name, status=status, path=skill_file))
+        return entries
+    
+    def load_skills(self, status: str = "all") -> Dict[str, Skill]:
+        """Load skills with the given status, parsing only the matching files."""
+        if status == "all":
+            return self.load_all_skills()
+        
+        skills = {}
+        for entry in self.load_skills_index():
+            if entry.status != status:
+                continue
+            skill = self._parse_skill(entry.path)
+            if skill:
+                skills[f"{entry.path.parent.name}/{skill.name}"] = skill
         return skills
     
     def get_skill(self, name: str, status: str = None) -> Optional[Skill]:
@@ -190,11 +282,21 @@ class SkillManager:
         return None
     
     def find_relevant_skills(self, task_description: str, limit: int = 3) -> List[Skill]:
-        """Find skills relevant to a task based on keyword matching."""
+        """Find skills relevant to a task based on keyword matching.
+        
+        Results are cached per description until the skills are reloaded.
+        """
         if not self._skills_cache:
             self.load_all_skills()
         
+        cache_key = (hashlib.blake2b(task_description.encode(), digest_size=16).digest(), limit)
+        keys = self._relevance_cache.get(cache_key)
+        if keys is not None:
+            self._relevance_cache.move_to_end(cache_key)
+            return [self._skills_cache[k] for k in keys if k in self._skills_cache]
+        
         task_lower = task_description.lower()
+        task_words = set(task_lower.split())
         scored_skills = []
         
         for key, skill in self._skills_cache.items():
@@ -202,27 +304,31 @@ class SkillManager:
             if skill.status in ["deprecated", "failed"]:
                 continue
             
-            # Simple keyword scoring
-            score = 0
-            searchable = f"{skill.name} {skill.purpose} {skill.triggers}".lower()
+            terms = self._search_terms.get(key)
+            if terms is None:
+                searchable = f"{skill.name} {skill.purpose} {skill.triggers}".lower()
+                terms = (frozenset(searchable.split()), skill.name.lower())
+                self._search_terms[key] = terms
+            skill_words, name_lower = terms
             
-            # Check for keyword matches
-            task_words = set(task_lower.split())
-            skill_words = set(searchable.split())
-            common = task_words & skill_words
-            score = len(common)
+            # Simple keyword scoring
+            score = len(task_words & skill_words)
             
             # Boost for exact name match
-            if skill.name.lower() in task_lower:
+            if name_lower in task_lower:
                 score += 5
             
             if score > 0:
-                scored_skills.append((score, skill))
+                scored_skills.append((score, key))
         
         # Sort by score descending
         scored_skills.sort(key=lambda x: x[0], reverse=True)
         
-        return [skill for _, skill in scored_skills[:limit]]
+        keys = [key for _, key in scored_skills[:limit]]
+        self._relevance_cache[cache_key] = keys
+        if len(self._relevance_cache) > self.RELEVANCE_CACHE_SIZE:
+            self._relevance_cache.popitem(last=False)
+        return [self._skills_cache[k] for k in keys]
     
     def record_skill_use(self, skill_name: str, success: bool) -> None:
         """Record that a skill was used."""
@@ -253,6 +359,9 @@ class SkillManager:
             track["failure_count"] = track.get("failure_count", 0) + 1
         
         self._save_tracking()
+        
+        # Cached skills carry the old counters
+        self._skills_fingerprint = None
         logger.info(f"Recorded {'success' if success else 'failure'} for skill {skill_name}")
     
     def get_skill_stats(self, skill_name: str) -> Dict[str, Any]:
@@ -261,6 +370,21 @@ class SkillManager:
         if not skill:
             return {}
         
+        return self._stats_for(skill)
+    
+    def get_all_skill_stats(self, skills: List[Skill] = None) -> Dict[str, Dict[str, Any]]:
+        """Get usage statistics keyed by skill name, for the given skills or all loaded ones."""
+        if skills is not None:
+            return {skill.name: self._stats_for(skill) for skill in skills}
+        
+        if not self._skills_cache:
+            self.load_all_skills()
+        
+        names = {skill.name for skill in self._skills_cache.values()}
+        return {name: self._stats_for(self.get_skill(name)) for name in names}
+    
+    def _stats_for(self, skill: Skill) -> Dict[str, Any]:
+        """Build the stats dict for an already-resolved skill."""
         track_key = f"{skill.status}/{skill.name}"
         track = self.tracking.get("skills", {}).get(track_key, {})
         
@@ -353,16 +477,15 @@ Status: candidate
         """Get candidate skills that meet promotion criteria."""
         promotable = []
         
-        candidates_dir = self.skills_dir / "candidates"
-        if not candidates_dir.exists():
-            return []
+        skills = self.load_all_skills()
+        all_stats = self.get_all_skill_stats()
         
-        for skill_file in candidates_dir.glob("*.md"):
-            skill = self._parse_skill(skill_file)
-            if skill:
-                stats = self.get_skill_stats(skill.name)
-                if stats.get("ready_for_promotion"):
-                    promotable.append(stats)
+        for key, skill in skills.items():
+            if not key.startswith("candidates/"):
+                continue
+            stats = all_stats.get(skill.name, {})
+            if stats.get("ready_for_promotion"):
+                promotable.append(stats)
         
         return promotable
     
@@ -462,6 +585,7 @@ Status: candidate
     def _update_index(self) -> None:
         """Regenerate the skills index."""
         self.load_all_skills()
+        all_stats = self.get_all_skill_stats()
         
         # Group by status
         by_status = {"core": [], "candidates": [], "learned": [], "deprecated": [], "failed": []}
@@ -510,7 +634,7 @@ Skills are documented procedures. When processing a task:
 |-------|---------|------|--------------|-------------|
 """
         for skill in sorted(by_status["learned"], key=lambda s: s.name):
-            stats = self.get_skill_stats(skill.name)
+            stats = all_stats.get(skill.name, {})
             uses = stats.get("use_count", 0)
             successes = stats.get("success_count", 0)
             rate = f"{(successes/uses*100):.0f}%" if uses > 0 else "N/A"
@@ -526,7 +650,7 @@ Skills are documented procedures. When processing a task:
 |-------|---------|------|-----------|--------|
 """
         for skill in sorted(by_status["candidates"], key=lambda s: s.name):
-            stats = self.get_skill_stats(skill.name)
+            stats = all_stats.get(skill.name, {})
             uses = stats.get("use_count", 0)
             successes = stats.get("success_count", 0)
             ready = "✅" if stats.get("ready_for_promotion") else f"Need {3 - successes} more"
@@ -604,33 +728,10 @@ Skills are documented procedures. When processing a task:
         if not llm_provider or not success:
             return None
         
-        from .llm import Message
+        from .llm import Message, system_message
         
         messages = [
-            Message(
-                role="system",
-                content="""You identify reusable procedures from task outcomes.
-
-A task outcome should become a SKILL when:
-1. It involved a multi-step procedure (not just one command)
-2. The procedure is likely to be needed again for similar tasks
-3. The procedure has clear inputs and outputs
-4. It's not already a common/trivial operation
-
-Examples of good skills to draft:
-- "Deploy Python App" - multi-step: test, build, deploy, verify
-- "Analyze Log Files" - pattern matching, summarization
-- "Set Up Development Environment" - install dependencies, configure tools
-- "Database Backup and Verify" - dump, compress, checksum, store
-
-Examples of things that are NOT skills:
-- Running a single command like "ls" or "cat"
-- One-time fixes or cleanups
-- Tasks that are too specific to reuse
-- Things the shell already does naturally
-
-If the task doesn't represent a reusable procedure, respond: NO_SKILL"""
-            ),
+            system_message(_SKILL_DRAFT_SYSTEM_PROMPT),
             Message(
                 role="user",
                 content=f"""Task: {task_description}
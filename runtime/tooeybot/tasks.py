@@ -91,6 +91,15 @@ class TaskParser:
         re.DOTALL | re.MULTILINE
     )
     
+    # "## Success criteria" followed by a bullet list
+    CRITERIA_PATTERN = re.compile(
+        r'##\s*Success\s+criteria\s*\n((?:[-*]\s+[^\n]+\n?)+)',
+        re.IGNORECASE
+    )
+    
+    # Leading markdown header line
+    HEADER_PATTERN = re.compile(r'^#\s+[^\n]+\n')
+    
     def parse_inbox(self, content: str) -> List[Task]:
         """Parse all tasks from inbox content."""
         tasks = []
@@ -128,11 +137,7 @@ class TaskParser:
             
             # Extract success criteria
             criteria = []
-            criteria_match = re.search(
-                r'##\s*Success\s+criteria\s*\n((?:[-*]\s+[^\n]+\n?)+)',
-                body,
-                re.IGNORECASE
-            )
+            criteria_match = self.CRITERIA_PATTERN.search(body)
             if criteria_match:
                 criteria_text = criteria_match.group(1)
                 criteria = [
@@ -147,7 +152,7 @@ class TaskParser:
                 description = body[:criteria_match.start()].strip()
             
             # Remove markdown header if present
-            description = re.sub(r'^#\s+[^\n]+\n', '', description).strip()
+            description = self.HEADER_PATTERN.sub('', description).strip()
             
             tasks.append(Task(
                 task_id=task_id,
@@ -188,26 +193,43 @@ class TaskManager:
         
         self.parser = TaskParser()
     
+    @staticmethod
+    def _read_if_exists(path: Path) -> Optional[str]:
+        """Read a task file, returning None if it doesn't exist."""
+        try:
+            return path.read_text()
+        except FileNotFoundError:
+            return None
+    
     def get_pending_tasks(self) -> List[Task]:
         """Get all pending tasks from inbox."""
-        if not self.inbox_path.exists():
+        content = self._read_if_exists(self.inbox_path)
+        if content is None:
             return []
         
-        content = self.inbox_path.read_text()
         return self.parser.parse_inbox(content)
     
     def get_active_task(self) -> Optional[Task]:
         """Get the currently active task."""
-        if not self.active_path.exists():
-            return None
-        
-        content = self.active_path.read_text()
-        if "*No active task*" in content:
+        content = self._read_if_exists(self.active_path)
+        if content is None or "*No active task*" in content:
             return None
         
         tasks = self.parser.parse_inbox(content)
         return tasks[0] if tasks else None
     
+    def snapshot(self) -> Dict[str, List[Task]]:
+        """Read both active.md and inbox.md, for callers that need every task.
+        
+        Returns {"active": [...], "pending": [...]}; "active" holds at most
+        one task.
+        """
+        active = self.get_active_task()
+        return {
+            "active": [active] if active else [],
+            "pending": self.get_pending_tasks(),
+        }
+    
     def activate_task(self, task: Task) -> None:
         """Move a task from inbox to active."""
         # Write to active
@@ -348,21 +370,16 @@ priority: {priority}
         """Count tasks by origin for analytics."""
         counts = {o.value: 0 for o in TaskOrigin}
         
-        for task in self.get_pending_tasks():
+        snap = self.snapshot()
+        for task in snap["pending"] + snap["active"]:
             counts[task.origin.value] = counts.get(task.origin.value, 0) + 1
         
-        active = self.get_active_task()
-        if active:
-            counts[active.origin.value] = counts.get(active.origin.value, 0) + 1
-        
         return counts
     
     def get_task_tree(self, root_task_id: str) -> Dict[str, Any]:
         """Get a task and all its child tasks (subtasks)."""
-        all_tasks = self.get_pending_tasks()
-        active = self.get_active_task()
-        if active:
-            all_tasks.append(active)
+        snap = self.snapshot()
+        all_tasks = snap["pending"] + snap["active"]
         
         def find_children(parent_id: str) -> List[Dict[str, Any]]:
             children = []
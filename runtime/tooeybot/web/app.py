@@ -10,6 +10,7 @@ Provides a web interface for:
 - Agent control (tick, maintenance, snapshots)
 """
 
+import asyncio
 import json
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -58,6 +59,10 @@ templates = Jinja2Templates(directory=str(templates_dir))
 config: Optional[Config] = None
 agent_home: Optional[Path] = None
 
+# Ticks run in worker threads; one at a time, so two requests can't pick up
+# and execute the same pending task
+_tick_lock = asyncio.Lock()
+
 
 def get_config() -> Config:
     """Get or load configuration."""
@@ -274,7 +279,8 @@ async def run_tick(request: Request):
     """Run a single agent tick."""
     cfg = get_config()
     agent = Agent(cfg)
-    result = agent.tick()
+    async with _tick_lock:
+        result = await agent.atick()
     
     return RedirectResponse(url="/tasks", status_code=303)
 
@@ -663,11 +669,12 @@ async def skills_page(request: Request):
     
     skills = skill_mgr.load_all_skills()
     
+    all_stats = skill_mgr.get_all_skill_stats()
+    
     # Group by status
     by_status = {"core": [], "learned": [], "candidate": []}
     for key, skill in skills.items():
-        stats = skill_mgr.get_skill_stats(skill.name)
-        skill.stats = stats
+        skill.stats = all_stats.get(skill.name, {})
         by_status.setdefault(skill.status, []).append(skill)
     
     # Get promotable candidates
@@ -888,7 +895,8 @@ async def control_tick(request: Request):
     """Run agent tick."""
     cfg = get_config()
     agent = Agent(cfg)
-    result = agent.tick()
+    async with _tick_lock:
+        result = await agent.atick()
     return {"success": result.success, "message": result.message}
 
 